@@ -21,7 +21,8 @@ class DaemonEventPublisher:
 
     Provides typed convenience methods for publishing events, wrapping
     the underlying EventBus. This class is used by the daemon to emit
-    events that monitors can subscribe to.
+    events that monitors can subscribe to. When no monitor is subscribed,
+    the methods return 0 without constructing the event.
 
     Example:
         bus = EventBus()
@@ -55,9 +56,10 @@ class DaemonEventPublisher:
         Returns:
             Number of subscribers that received the event
         """
-        event = Event.command_received(command, working_dir, client_pid)
         logger.debug(f"Publishing command_received: {command} (pid={client_pid})")
-        return await self._bus.publish(event)
+        if not self._bus:
+            return 0
+        return await self._bus.publish(Event.command_received(command, working_dir, client_pid))
 
     async def evaluation_started(self, command: str, plugin_count: int) -> int:
         """Publish an evaluation started event.
@@ -69,9 +71,10 @@ class DaemonEventPublisher:
         Returns:
             Number of subscribers that received the event
         """
-        event = Event.evaluation_started(command, plugin_count)
         logger.debug(f"Publishing evaluation_started: {command} ({plugin_count} plugins)")
-        return await self._bus.publish(event)
+        if not self._bus:
+            return 0
+        return await self._bus.publish(Event.evaluation_started(command, plugin_count))
 
     async def evaluation_completed(
         self,
@@ -91,9 +94,12 @@ class DaemonEventPublisher:
         Returns:
             Number of subscribers that received the event
         """
-        event = Event.evaluation_completed(command, decision, plugin_name, reason)
         logger.debug(f"Publishing evaluation_completed: {command} -> {decision.value}")
-        return await self._bus.publish(event)
+        if not self._bus:
+            return 0
+        return await self._bus.publish(
+            Event.evaluation_completed(command, decision, plugin_name, reason)
+        )
 
     async def approval_needed(
         self,
@@ -119,13 +125,16 @@ class DaemonEventPublisher:
         Returns:
             Number of subscribers that received the event
         """
-        event = Event.approval_needed(
-            approval_id, command, plugin_name, reason, working_dir, client_pid, challenge_code
-        )
         logger.info(
             f"Publishing approval_needed: {command} (id={approval_id[:_ID_LOG_PREVIEW_LENGTH]}...)"
         )
-        return await self._bus.publish(event)
+        if not self._bus:
+            return 0
+        return await self._bus.publish(
+            Event.approval_needed(
+                approval_id, command, plugin_name, reason, working_dir, client_pid, challenge_code
+            )
+        )
 
     async def approval_resolved(
         self,
@@ -147,12 +156,15 @@ class DaemonEventPublisher:
         Returns:
             Number of subscribers that received the event
         """
-        event = Event.approval_resolved(approval_id, approved, reason, working_dir, client_pid)
         status = "approved" if approved else "denied"
         logger.info(
             f"Publishing approval_resolved: {approval_id[:_ID_LOG_PREVIEW_LENGTH]}... -> {status}"
         )
-        return await self._bus.publish(event)
+        if not self._bus:
+            return 0
+        return await self._bus.publish(
+            Event.approval_resolved(approval_id, approved, reason, working_dir, client_pid)
+        )
 
     async def daemon_status(
         self,
@@ -172,6 +184,9 @@ class DaemonEventPublisher:
         Returns:
             Number of subscribers that received the event
         """
-        event = Event.daemon_status(status, uptime_seconds, commands_processed, active_connections)
         logger.debug(f"Publishing daemon_status: {status}")
-        return await self._bus.publish(event)
+        if not self._bus:
+            return 0
+        return await self._bus.publish(
+            Event.daemon_status(status, uptime_seconds, commands_processed, active_connections)
+        )
@@ -10,7 +10,7 @@ Overview: Handles monitor client connections and streams events to them
 
 import asyncio
 from enum import Enum
-from typing import Any
+from typing import Any, Final
 
 from loguru import logger
 from pydantic import BaseModel, Field
@@ -37,6 +37,10 @@ class MonitorCommandType(str, Enum):
     GET_STATUS = "get_status"
 
 
+# Raw wire value, resolved once so ping can be matched before model validation
+_PING_TYPE: Final = MonitorCommandType.PING.value
+
+
 class MonitorCommand(BaseModel):
     """Command from monitor to daemon."""
 
@@ -47,6 +51,10 @@ class MonitorCommand(BaseModel):
     enabled: bool | None = Field(default=None, description="Enable/disable protection")
 
 
+# Bound once so per-command validation skips the model_validate method dispatch
+_COMMAND_VALIDATOR = MonitorCommand.__pydantic_validator__
+
+
 class MonitorResponse(BaseModel):
     """Response from daemon to monitor."""
 
@@ -65,11 +73,19 @@ class MonitorResponse(BaseModel):
         return cls(success=False, error=error)
 
 
+# Fixed replies never change, so one instance of each is shared across all connections
+_PONG = MonitorResponse.ok("pong")
+_ERR_MISSING_APPROVAL_ID = MonitorResponse.err("approval_id required")
+_ERR_MISSING_ENABLED = MonitorResponse.err("enabled field required")
+_ERR_APPROVAL_NOT_CONFIGURED = MonitorResponse.err("Approval system not configured")
+_ERR_CONTROL_NOT_CONFIGURED = MonitorResponse.err("Control system not configured")
+
+
 class MonitorEventMessage(BaseModel):
     """Event message sent from daemon to monitor."""
 
     type: str = Field(default="event", description="Message type")
-    event: dict[str, Any] = Field(description="The event data")
+    event: Event = Field(description="The event data")
 
 
 class MonitorConnectionHandler:
@@ -200,8 +216,8 @@ class MonitorConnectionHandler:
             event: Event to send
         """
         try:
-            # Serialize event with JSON-compatible datetime
-            event_msg = MonitorEventMessage(event=event.model_dump(mode="json"))
+            # Nest the model itself so encoding walks the event once, in pydantic-core
+            event_msg = MonitorEventMessage.model_construct(event=event)
             await write_message(writer, event_msg)
         except (BrokenPipeError, ConnectionResetError):
             # Connection closed, will be handled by main loop
@@ -250,27 +266,29 @@ class MonitorConnectionHandler:
         Returns:
             Response to send to client
         """
+        # Ping carries no payload and is the most frequent command. decode_message
+        # may return any JSON value, so non-objects fall through to validation
+        if isinstance(message, dict) and message.get("type") == _PING_TYPE:
+            return _PONG
+
         try:
-            command = MonitorCommand.model_validate(message)
+            command: MonitorCommand = _COMMAND_VALIDATOR.validate_python(message)
         except Exception as e:
             return MonitorResponse.err(f"Invalid command: {e}")
 
-        if command.type == MonitorCommandType.PING:
-            return MonitorResponse.ok("pong")
-
         if command.type == MonitorCommandType.APPROVE:
             if not command.approval_id:
-                return MonitorResponse.err("approval_id required")
+                return _ERR_MISSING_APPROVAL_ID
             return await self._handle_approve(command.approval_id, command.remember)
 
         if command.type == MonitorCommandType.DENY:
             if not command.approval_id:
-                return MonitorResponse.err("approval_id required")
+                return _ERR_MISSING_APPROVAL_ID
             return await self._handle_deny(command.approval_id, command.reason, command.remember)
 
         if command.type == MonitorCommandType.SET_ENABLED:
             if command.enabled is None:
-                return MonitorResponse.err("enabled field required")
+                return _ERR_MISSING_ENABLED
             return await self._handle_set_enabled(command.enabled)
 
         if command.type == MonitorCommandType.RELOAD_RULES:
@@ -292,7 +310,7 @@ class MonitorConnectionHandler:
             Response indicating success or failure
         """
         if not self._approve_callback:
-            return MonitorResponse.err("Approval system not configured")
+            return _ERR_APPROVAL_NOT_CONFIGURED
 
         try:
             await self._approve_callback(approval_id, remember=remember)
@@ -315,7 +333,7 @@ class MonitorConnectionHandler:
             Response indicating success or failure
         """
         if not self._deny_callback:
-            return MonitorResponse.err("Approval system not configured")
+            return _ERR_APPROVAL_NOT_CONFIGURED
 
         try:
             await self._deny_callback(approval_id, reason, remember=remember)
@@ -334,7 +352,7 @@ class MonitorConnectionHandler:
             Response indicating success or failure
         """
         if not self._set_enabled_callback:
-            return MonitorResponse.err("Control system not configured")
+            return _ERR_CONTROL_NOT_CONFIGURED
 
         try:
             await self._set_enabled_callback(enabled)
@@ -350,7 +368,7 @@ class MonitorConnectionHandler:
             Response indicating success or failure
         """
         if not self._reload_rules_callback:
-            return MonitorResponse.err("Control system not configured")
+            return _ERR_CONTROL_NOT_CONFIGURED
 
         try:
             await self._reload_rules_callback()
@@ -365,7 +383,7 @@ class MonitorConnectionHandler:
             Response with current daemon status
         """
         if not self._get_status_callback:
-            return MonitorResponse.err("Control system not configured")
+            return _ERR_CONTROL_NOT_CONFIGURED
 
         try:
             status = await self._get_status_callback()
@@ -2,15 +2,15 @@
 File: src/safeshell/daemon/protocol.py
 Purpose: JSON lines protocol for daemon IPC
 Exports: encode_message, decode_message, read_message, write_message
-Depends: json, asyncio, safeshell.models, safeshell.exceptions
+Depends: asyncio, pydantic, pydantic_core, safeshell.exceptions
 Overview: Handles serialization and deserialization of messages between wrapper and daemon
 """
 
 import asyncio
-import json
 from typing import Any
 
 from pydantic import BaseModel
+from pydantic_core import from_json
 
 from safeshell.exceptions import ProtocolError
 
@@ -24,7 +24,8 @@ def encode_message(msg: BaseModel) -> bytes:
     Returns:
         UTF-8 encoded JSON with trailing newline
     """
-    return msg.model_dump_json().encode("utf-8") + b"\n"
+    # Serialize straight to bytes, skipping model_dump_json's intermediate str
+    return msg.__pydantic_serializer__.to_json(msg) + b"\n"
 
 
 def decode_message(data: bytes) -> dict[str, Any]:
@@ -40,9 +41,9 @@ def decode_message(data: bytes) -> dict[str, Any]:
         ProtocolError: If JSON parsing fails
     """
     try:
-        result: dict[str, Any] = json.loads(data.decode("utf-8"))
+        result: dict[str, Any] = from_json(data)
         return result
-    except (json.JSONDecodeError, UnicodeDecodeError) as e:
+    except ValueError as e:
         raise ProtocolError(f"Failed to decode message: {e}") from e
 
 
@@ -64,7 +65,8 @@ async def read_message(reader: asyncio.StreamReader) -> dict[str, Any]:
         line = await reader.readline()
         if not line:
             raise ProtocolError("Connection closed")
-        return decode_message(line.strip())
+        # JSON permits surrounding whitespace, so the newline needn't be stripped (no copy)
+        return decode_message(line)
     except asyncio.IncompleteReadError as e:
         raise ProtocolError(f"Incomplete read: {e}") from e
 
@@ -38,6 +38,9 @@ from safeshell.models import DaemonRequest, DaemonResponse, Decision
 # Socket permissions (owner read/write only)
 _SOCKET_PERMISSIONS = 0o600
 
+# Bound once so per-request validation skips the model_validate method dispatch
+_REQUEST_VALIDATOR = DaemonRequest.__pydantic_validator__
+
 
 class DaemonServer:
     """Asyncio-based Unix socket daemon server.
@@ -341,7 +344,7 @@ class DaemonServer:
             Response to send to client
         """
         try:
-            request = DaemonRequest.model_validate(message)
+            request: DaemonRequest = _REQUEST_VALIDATOR.validate_python(message)
 
             # Track command evaluation requests
             if request.type.value in ("evaluate", "execute"):
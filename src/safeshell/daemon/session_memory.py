@@ -2,14 +2,18 @@
 File: src/safeshell/daemon/session_memory.py
 Purpose: Session-scoped memory for "don't ask again" approvals
 Exports: SessionMemory, ApprovalMemoryKey
-Depends: dataclasses, time, loguru
+Depends: dataclasses, enum, heapq, math, time, weakref, loguru
 Overview: Tracks approved rule+command combinations for the current daemon session
 """
 
 from __future__ import annotations
 
+import heapq
+import math
 import time
-from dataclasses import dataclass
+from dataclasses import dataclass, field
+from enum import IntEnum
+from weakref import WeakValueDictionary
 
 from loguru import logger
 
@@ -17,7 +21,27 @@ from loguru import logger
 _DEFAULT_APPROVAL_MEMORY_TTL_SECONDS = 300
 
 
-@dataclass(frozen=True)
+class _State(IntEnum):
+    """Which decision a session memory entry remembers."""
+
+    APPROVED = 1
+    DENIED = 2
+
+
+# Upper bound on how often lookups trigger a batched purge of expired entries
+_MAX_PURGE_INTERVAL_SECONDS = 1.0
+
+
+def _never_expires(_deadline: float) -> bool:
+    """Expiry check for memories without a TTL; skips reading the clock."""
+    return False
+
+
+# Wording used in log messages for each state
+_STATE_LABELS = {_State.APPROVED: "approval", _State.DENIED: "denial"}
+
+
+@dataclass(frozen=True, slots=True, weakref_slot=True)
 class ApprovalMemoryKey:
     """Key for session memory: rule_name + base_command.
 
@@ -31,10 +55,46 @@ class ApprovalMemoryKey:
 
     rule_name: str
     base_command: str
+    _hash: int = field(init=False, repr=False, compare=False)
+    _str: str = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        """Precompute the hash and display form; keys are interned and reused."""
+        object.__setattr__(self, "_hash", hash((self.rule_name, self.base_command)))
+        object.__setattr__(self, "_str", f"{self.rule_name}:{self.base_command}")
+
+    def __hash__(self) -> int:
+        """Return the precomputed hash."""
+        return self._hash
+
+    @classmethod
+    def intern(cls, rule_name: str, base_command: str) -> ApprovalMemoryKey:
+        """Return the shared key instance for this rule + base command.
+
+        Reusing one instance lets dict probes match on identity instead of
+        comparing fields. Instances are dropped once nothing references them.
+        """
+        pair = (rule_name, base_command)
+        key = _INTERNED_KEYS.get(pair)
+        if key is None:
+            key = cls(rule_name=rule_name, base_command=base_command)
+            _INTERNED_KEYS[pair] = key
+        return key
 
     def __str__(self) -> str:
         """Return string representation of the key."""
-        return f"{self.rule_name}:{self.base_command}"
+        return self._str
+
+
+# Interned keys, kept alive only while session memory (or a caller) holds them
+_INTERNED_KEYS: WeakValueDictionary[tuple[str, str], ApprovalMemoryKey] = WeakValueDictionary()
+
+
+def _base_command(command: str) -> str:
+    """Return the executable (first word) of a command, or "" if it is blank."""
+    # maxsplit stops after the first token
+    parts = command.split(maxsplit=1)
+    return parts[0] if parts else ""
 
 
 class SessionMemory:
@@ -48,7 +108,10 @@ class SessionMemory:
     - Different rules for same command are tracked separately
 
     Approvals can be time-bound with a configurable TTL. Expired approvals
-    are treated as if they never existed (user will be re-prompted).
+    are treated as if they never existed (user will be re-prompted). Expired
+    entries are removed in batches by purge_expired(), which lookups run at
+    most every tenth of the TTL (capped at one second) using a min-heap of
+    deadlines.
 
     Thread Safety:
         This class is not thread-safe. It's designed for use within
@@ -62,9 +125,17 @@ class SessionMemory:
             ttl_seconds: Time-to-live for approvals in seconds. Default is 300 (5 min).
                         Set to 0 for no time expiry (session-only).
         """
-        self._approved: dict[ApprovalMemoryKey, float] = {}  # key -> approval timestamp
-        self._denied: dict[ApprovalMemoryKey, float] = {}  # key -> denial timestamp
+        # key -> (approved/denied, monotonic expiry deadline or math.inf, generation)
+        self._entries: dict[ApprovalMemoryKey, tuple[_State, float, int]] = {}
+        # Min-heap of (deadline, generation, key) for entries with a TTL. Entries
+        # overwritten or evicted since being pushed are skipped by generation.
+        self._deadlines: list[tuple[float, int, ApprovalMemoryKey]] = []
+        self._generation = 0
         self._ttl_seconds = ttl_seconds
+        self._purge_interval = min(ttl_seconds / 10, _MAX_PURGE_INTERVAL_SECONDS)
+        self._last_purge = 0.0
+        # Chosen once so lookups don't branch on the TTL (or read the clock without one)
+        self._is_expired = self._deadline_passed if ttl_seconds > 0 else _never_expires
 
     def is_pre_approved(self, rule_name: str, command: str) -> bool:
         """Check if rule+command combination was pre-approved.
@@ -78,20 +149,7 @@ class SessionMemory:
         Returns:
             True if this combination was approved with "don't ask again" and hasn't expired
         """
-        key = self._make_key(rule_name, command)
-        if key not in self._approved:
-            return False
-
-        # Check TTL
-        if self._ttl_seconds > 0:
-            elapsed = time.time() - self._approved[key]
-            if elapsed >= self._ttl_seconds:
-                # Expired - remove from cache
-                logger.debug(f"Approval expired for {key} (elapsed: {elapsed:.1f}s)")
-                del self._approved[key]
-                return False
-
-        return True
+        return self._is_active(self._find_key(rule_name, command), _State.APPROVED)
 
     def is_pre_denied(self, rule_name: str, command: str) -> bool:
         """Check if rule+command combination was pre-denied.
@@ -105,20 +163,7 @@ class SessionMemory:
         Returns:
             True if this combination was denied with "don't ask again" and hasn't expired
         """
-        key = self._make_key(rule_name, command)
-        if key not in self._denied:
-            return False
-
-        # Check TTL
-        if self._ttl_seconds > 0:
-            elapsed = time.time() - self._denied[key]
-            if elapsed >= self._ttl_seconds:
-                # Expired - remove from cache
-                logger.debug(f"Denial expired for {key} (elapsed: {elapsed:.1f}s)")
-                del self._denied[key]
-                return False
-
-        return True
+        return self._is_active(self._find_key(rule_name, command), _State.DENIED)
 
     def get_approval_remaining_seconds(self, rule_name: str, command: str) -> float | None:
         """Get remaining seconds for a pre-approval.
@@ -130,16 +175,7 @@ class SessionMemory:
         Returns:
             Remaining seconds until expiry, or None if not pre-approved
         """
-        key = self._make_key(rule_name, command)
-        if key not in self._approved:
-            return None
-
-        if self._ttl_seconds <= 0:
-            return None  # No expiry
-
-        elapsed = time.time() - self._approved[key]
-        remaining = self._ttl_seconds - elapsed
-        return max(0.0, remaining)
+        return self._remaining_seconds(self._find_key(rule_name, command), _State.APPROVED)
 
     def get_denial_remaining_seconds(self, rule_name: str, command: str) -> float | None:
         """Get remaining seconds for a pre-denial.
@@ -151,56 +187,104 @@ class SessionMemory:
         Returns:
             Remaining seconds until expiry, or None if not pre-denied
         """
-        key = self._make_key(rule_name, command)
-        if key not in self._denied:
-            return None
-
-        if self._ttl_seconds <= 0:
-            return None  # No expiry
-
-        elapsed = time.time() - self._denied[key]
-        remaining = self._ttl_seconds - elapsed
-        return max(0.0, remaining)
+        return self._remaining_seconds(self._find_key(rule_name, command), _State.DENIED)
 
     def remember_approval(self, rule_name: str, command: str) -> None:
         """Remember an approval for this session.
 
+        Replaces any earlier denial for the same key.
+
         Args:
             rule_name: Name of the rule that triggered approval
             command: Full command string
         """
-        key = self._make_key(rule_name, command)
-        self._approved[key] = time.time()
-        # Remove from denied if it was there
-        self._denied.pop(key, None)
-        logger.info(
-            f"Session memory: remembered approval for {key}"
-            + (f" (TTL: {self._ttl_seconds}s)" if self._ttl_seconds > 0 else " (no expiry)")
-        )
+        self._remember(self._make_key(rule_name, command), _State.APPROVED)
 
     def remember_denial(self, rule_name: str, command: str) -> None:
         """Remember a denial for this session.
 
+        Replaces any earlier approval for the same key.
+
         Args:
             rule_name: Name of the rule that triggered approval
             command: Full command string
         """
-        key = self._make_key(rule_name, command)
-        self._denied[key] = time.time()
-        # Remove from approved if it was there
-        self._approved.pop(key, None)
-        logger.info(
-            f"Session memory: remembered denial for {key}"
-            + (f" (TTL: {self._ttl_seconds}s)" if self._ttl_seconds > 0 else " (no expiry)")
-        )
+        self._remember(self._make_key(rule_name, command), _State.DENIED)
 
     def clear(self) -> None:
         """Clear all session memory."""
-        count = len(self._approved) + len(self._denied)
-        self._approved.clear()
-        self._denied.clear()
+        count = len(self._entries)
+        self._entries.clear()
+        self._deadlines.clear()
         logger.info(f"Session memory cleared ({count} entries)")
 
+    def purge_expired(self, now: float | None = None) -> int:
+        """Remove every expired entry.
+
+        Args:
+            now: Monotonic time to compare deadlines against (default: current time)
+
+        Returns:
+            Number of entries removed
+        """
+        if now is None:
+            now = time.monotonic()
+        self._last_purge = now
+        deadlines = self._deadlines
+        removed = 0
+        while deadlines and deadlines[0][0] <= now:
+            _, generation, key = heapq.heappop(deadlines)
+            entry = self._entries.get(key)
+            if entry is not None and entry[2] == generation:
+                del self._entries[key]
+                removed += 1
+        if removed:
+            logger.debug(f"Session memory purged {removed} expired entries")
+        return removed
+
+    def _is_active(self, key: ApprovalMemoryKey | None, state: _State) -> bool:
+        """Check for an unexpired entry in the given state."""
+        if key is None:
+            return False
+        entry = self._entries.get(key)
+        if entry is None or entry[0] is not state:
+            return False
+        return not self._is_expired(entry[1])
+
+    def _deadline_passed(self, deadline: float) -> bool:
+        """Return True if a deadline is in the past, purging in batches when due.
+
+        An expired entry stays in place until the next purge; the deadline
+        check alone keeps lookups accurate in the meantime.
+        """
+        now = time.monotonic()
+        if now - self._last_purge >= self._purge_interval:
+            self.purge_expired(now)
+        return deadline <= now
+
+    def _remaining_seconds(self, key: ApprovalMemoryKey | None, state: _State) -> float | None:
+        """Return seconds until the entry expires, or None if absent or unbounded."""
+        if key is None:
+            return None
+        entry = self._entries.get(key)
+        if entry is None or entry[0] is not state or entry[1] == math.inf:
+            return None
+
+        return max(0.0, entry[1] - time.monotonic())
+
+    def _remember(self, key: ApprovalMemoryKey, state: _State) -> None:
+        """Store an entry, overwriting whatever decision was remembered before."""
+        self._generation += 1
+        if self._ttl_seconds > 0:
+            deadline = time.monotonic() + self._ttl_seconds
+            self._entries[key] = (state, deadline, self._generation)
+            heapq.heappush(self._deadlines, (deadline, self._generation, key))
+            suffix = f" (TTL: {self._ttl_seconds}s)"
+        else:
+            self._entries[key] = (state, math.inf, self._generation)
+            suffix = " (no expiry)"
+        logger.info(f"Session memory: remembered {_STATE_LABELS[state]} for {key}{suffix}")
+
     def _make_key(self, rule_name: str, command: str) -> ApprovalMemoryKey:
         """Create memory key from rule name and command.
 
@@ -211,9 +295,22 @@ class SessionMemory:
         Returns:
             ApprovalMemoryKey with rule name and base command (executable)
         """
-        # Extract base command (first word)
-        base_command = command.split()[0] if command else ""
-        return ApprovalMemoryKey(rule_name=rule_name, base_command=base_command)
+        return ApprovalMemoryKey.intern(rule_name, _base_command(command))
+
+    def _find_key(self, rule_name: str, command: str) -> ApprovalMemoryKey | None:
+        """Return the interned key for a lookup without creating one.
+
+        Most lookups are misses; a key that was never interned cannot have
+        an entry, so there is nothing to build.
+
+        Args:
+            rule_name: Name of the rule
+            command: Full command string
+
+        Returns:
+            The existing ApprovalMemoryKey, or None if none is interned
+        """
+        return _INTERNED_KEYS.get((rule_name, _base_command(command)))
 
     @property
     def ttl_seconds(self) -> int:
@@ -225,10 +322,13 @@ class SessionMemory:
         """Get memory statistics.
 
         Returns:
-            Dict with approved_count, denied_count, and ttl_seconds
+            Dict with approved_count, denied_count, and ttl_seconds. Expired
+            entries are purged first so they are not counted.
         """
+        self.purge_expired()
+        approved_count = sum(1 for entry in self._entries.values() if entry[0] is _State.APPROVED)
         return {
-            "approved_count": len(self._approved),
-            "denied_count": len(self._denied),
+            "approved_count": approved_count,
+            "denied_count": len(self._entries) - approved_count,
             "ttl_seconds": self._ttl_seconds,
         }
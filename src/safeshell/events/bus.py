@@ -2,12 +2,12 @@
 File: src/safeshell/events/bus.py
 Purpose: Async event bus for daemon-monitor communication
 Exports: EventBus
-Depends: asyncio, uuid, loguru
+Depends: asyncio, itertools, loguru
 Overview: Provides pub/sub infrastructure for streaming events from daemon to monitors
 """
 
 import asyncio
-import uuid
+import itertools
 from collections.abc import Awaitable, Callable
 
 from loguru import logger
@@ -21,6 +21,30 @@ EventCallback = Callable[[Event], Awaitable[None]]
 _ID_LOG_PREVIEW_LENGTH = 8
 
 
+async def _safe_invoke(sub_id: str, callback: EventCallback, event: Event) -> bool:
+    """Deliver an event to a single subscriber.
+
+    The callback is called inside the try so a synchronous raise is caught too.
+    Cancellation propagates; any other error is logged.
+
+    Args:
+        sub_id: Subscriber ID for logging
+        callback: The subscriber's callback function
+        event: The event to deliver
+
+    Returns:
+        True if delivery succeeded, False otherwise.
+    """
+    try:
+        await callback(event)
+        return True
+    except asyncio.CancelledError:
+        raise
+    except Exception as e:
+        logger.exception(f"Error delivering event to {sub_id[:_ID_LOG_PREVIEW_LENGTH]}...: {e}")
+        return False
+
+
 class EventBus:
     """Async event bus for daemon-monitor communication.
 
@@ -30,7 +54,9 @@ class EventBus:
 
     Thread Safety:
         This class is designed for single-threaded async use. All operations
-        should be called from the same event loop.
+        should be called from the same event loop. Mutations never await, so
+        the loop's serial execution makes them atomic without a lock; publish()
+        works from a snapshot taken before it yields.
 
     Example:
         bus = EventBus()
@@ -45,8 +71,15 @@ class EventBus:
 
     def __init__(self) -> None:
         """Initialize the event bus with no subscribers."""
-        self._subscribers: dict[str, EventCallback] = {}
-        self._lock = asyncio.Lock()
+        # Subscribers as parallel arrays (dense, cheap to iterate) plus an
+        # id -> position index for O(1) unsubscribe
+        self._ids: list[str] = []
+        self._funcs: list[EventCallback] = []
+        self._index: dict[str, int] = {}
+        # Immutable (id, callback) view for publish(); rebuilt lazily after changes
+        self._snapshot: tuple[tuple[str, EventCallback], ...] | None = None
+        # IDs only need to be unique within this bus, so a counter suffices
+        self._id_counter = itertools.count(1)
 
     async def subscribe(self, callback: EventCallback) -> str:
         """Subscribe to events with a callback function.
@@ -58,9 +91,11 @@ class EventBus:
         Returns:
             Subscription ID that can be used to unsubscribe later.
         """
-        sub_id = str(uuid.uuid4())
-        async with self._lock:
-            self._subscribers[sub_id] = callback
+        sub_id = str(next(self._id_counter))
+        self._index[sub_id] = len(self._ids)
+        self._ids.append(sub_id)
+        self._funcs.append(callback)
+        self._snapshot = None
         logger.debug(f"Subscriber {sub_id[:_ID_LOG_PREVIEW_LENGTH]}... registered")
         return sub_id
 
@@ -73,11 +108,12 @@ class EventBus:
         Returns:
             True if subscriber was found and removed, False otherwise.
         """
-        async with self._lock:
-            if sub_id in self._subscribers:
-                del self._subscribers[sub_id]
-                logger.debug(f"Subscriber {sub_id[:_ID_LOG_PREVIEW_LENGTH]}... unregistered")
-                return True
+        position = self._index.pop(sub_id, None)
+        if position is not None:
+            self._remove_at(position)
+            self._snapshot = None
+            logger.debug(f"Subscriber {sub_id[:_ID_LOG_PREVIEW_LENGTH]}... unregistered")
+            return True
         logger.warning(f"Subscriber {sub_id[:_ID_LOG_PREVIEW_LENGTH]}... not found for unsubscribe")
         return False
 
@@ -94,46 +130,51 @@ class EventBus:
         Returns:
             Number of subscribers the event was delivered to.
         """
-        async with self._lock:
-            callbacks = list(self._subscribers.items())
-
-        if not callbacks:
+        if not self._funcs:
             logger.debug(f"No subscribers for event {event.type}")
             return 0
 
+        callbacks = self._snapshot
+        if callbacks is None:
+            callbacks = self._rebuild_snapshot()
+
         logger.debug(f"Publishing {event.type} to {len(callbacks)} subscribers")
 
-        # Deliver to all subscribers concurrently
+        # Deliver to all subscribers concurrently; _safe_invoke only lets
+        # cancellation through, so one failing subscriber cannot affect the others
         results = await asyncio.gather(
-            *[self._deliver(sub_id, callback, event) for sub_id, callback in callbacks],
-            return_exceptions=True,
+            *[_safe_invoke(sub_id, callback, event) for sub_id, callback in callbacks]
         )
 
         # Count successful deliveries
-        return sum(1 for r in results if r is True)
-
-    async def _deliver(self, sub_id: str, callback: EventCallback, event: Event) -> bool:
-        """Deliver an event to a single subscriber.
-
-        Args:
-            sub_id: Subscriber ID for logging
-            callback: The subscriber's callback function
-            event: The event to deliver
-
-        Returns:
-            True if delivery succeeded, False otherwise.
+        return sum(results)
+
+    def _rebuild_snapshot(self) -> tuple[tuple[str, EventCallback], ...]:
+        """Cache and return the current subscribers as an immutable tuple."""
+        self._snapshot = tuple(zip(self._ids, self._funcs, strict=True))
+        return self._snapshot
+
+    def _remove_at(self, position: int) -> None:
+        """Remove the subscriber at position by moving the last one into its slot."""
+        last_id = self._ids.pop()
+        last_func = self._funcs.pop()
+        if position < len(self._ids):
+            self._ids[position] = last_id
+            self._funcs[position] = last_func
+            self._index[last_id] = position
+
+    def __bool__(self) -> bool:
+        """Return True if anyone is subscribed.
+
+        Lets publishers skip building events nobody will receive:
+        ``if bus: await bus.publish(Event.command_received(...))``
         """
-        try:
-            await callback(event)
-            return True
-        except Exception as e:
-            logger.exception(f"Error delivering event to {sub_id[:_ID_LOG_PREVIEW_LENGTH]}...: {e}")
-            return False
+        return bool(self._funcs)
 
     @property
     def subscriber_count(self) -> int:
         """Return the current number of subscribers."""
-        return len(self._subscribers)
+        return len(self._funcs)
 
     async def clear(self) -> int:
         """Remove all subscribers.
@@ -141,15 +182,22 @@ class EventBus:
         Returns:
             Number of subscribers that were removed.
         """
-        async with self._lock:
-            count = len(self._subscribers)
-            self._subscribers.clear()
+        count = self._clear_subscribers()
         logger.debug(f"Cleared {count} subscribers")
         return count
 
+    def _clear_subscribers(self) -> int:
+        """Drop every subscriber and return how many there were."""
+        count = len(self._funcs)
+        self._ids.clear()
+        self._funcs.clear()
+        self._index.clear()
+        self._snapshot = None
+        return count
+
     def get_subscriber_ids(self) -> list[str]:
         """Return list of current subscriber IDs.
 
         Useful for debugging and testing.
         """
-        return list(self._subscribers.keys())
+        return list(self._ids)
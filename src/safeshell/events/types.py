@@ -16,6 +16,14 @@ from pydantic import BaseModel, Field
 from safeshell.models import Decision
 
 
+def _now() -> datetime:
+    """Return the current UTC time for event timestamps.
+
+    Module-level so the daemon (or tests) can swap in a cached clock.
+    """
+    return datetime.now(UTC)
+
+
 class EventType(str, Enum):
     """Types of events emitted by the daemon."""
 
@@ -96,29 +104,32 @@ class Event(BaseModel):
 
     type: EventType = Field(description="Type of the event")
     timestamp: datetime = Field(
-        default_factory=lambda: datetime.now(UTC),
+        default_factory=lambda: _now(),
         description="When the event occurred (UTC)",
     )
     data: dict[str, Any] = Field(description="Event-specific data")
 
+    @classmethod
+    def _from_payload(cls, event_type: EventType, payload: BaseModel) -> "Event":
+        """Wrap an already-validated payload without re-validating the envelope."""
+        return cls.model_construct(type=event_type, timestamp=_now(), data=payload.model_dump())
+
     @classmethod
     def command_received(
         cls, command: str, working_dir: str, client_pid: int | None = None
     ) -> "Event":
         """Create a COMMAND_RECEIVED event."""
-        return cls(
-            type=EventType.COMMAND_RECEIVED,
-            data=CommandReceivedEvent(
-                command=command, working_dir=working_dir, client_pid=client_pid
-            ).model_dump(),
+        return cls._from_payload(
+            EventType.COMMAND_RECEIVED,
+            CommandReceivedEvent(command=command, working_dir=working_dir, client_pid=client_pid),
         )
 
     @classmethod
     def evaluation_started(cls, command: str, plugin_count: int) -> "Event":
         """Create an EVALUATION_STARTED event."""
-        return cls(
-            type=EventType.EVALUATION_STARTED,
-            data=EvaluationStartedEvent(command=command, plugin_count=plugin_count).model_dump(),
+        return cls._from_payload(
+            EventType.EVALUATION_STARTED,
+            EvaluationStartedEvent(command=command, plugin_count=plugin_count),
         )
 
     @classmethod
@@ -130,11 +141,11 @@ class Event(BaseModel):
         reason: str | None = None,
     ) -> "Event":
         """Create an EVALUATION_COMPLETED event."""
-        return cls(
-            type=EventType.EVALUATION_COMPLETED,
-            data=EvaluationCompletedEvent(
+        return cls._from_payload(
+            EventType.EVALUATION_COMPLETED,
+            EvaluationCompletedEvent(
                 command=command, decision=decision, plugin_name=plugin_name, reason=reason
-            ).model_dump(),
+            ),
         )
 
     @classmethod
@@ -149,9 +160,9 @@ class Event(BaseModel):
         challenge_code: str | None = None,
     ) -> "Event":
         """Create an APPROVAL_NEEDED event."""
-        return cls(
-            type=EventType.APPROVAL_NEEDED,
-            data=ApprovalNeededEvent(
+        return cls._from_payload(
+            EventType.APPROVAL_NEEDED,
+            ApprovalNeededEvent(
                 approval_id=approval_id,
                 command=command,
                 plugin_name=plugin_name,
@@ -159,7 +170,7 @@ class Event(BaseModel):
                 working_dir=working_dir,
                 client_pid=client_pid,
                 challenge_code=challenge_code,
-            ).model_dump(),
+            ),
         )
 
     @classmethod
@@ -172,15 +183,15 @@ class Event(BaseModel):
         client_pid: int | None = None,
     ) -> "Event":
         """Create an APPROVAL_RESOLVED event."""
-        return cls(
-            type=EventType.APPROVAL_RESOLVED,
-            data=ApprovalResolvedEvent(
+        return cls._from_payload(
+            EventType.APPROVAL_RESOLVED,
+            ApprovalResolvedEvent(
                 approval_id=approval_id,
                 approved=approved,
                 reason=reason,
                 working_dir=working_dir,
                 client_pid=client_pid,
-            ).model_dump(),
+            ),
         )
 
     @classmethod
@@ -188,12 +199,12 @@ class Event(BaseModel):
         cls, status: str, uptime_seconds: float, commands_processed: int, active_connections: int
     ) -> "Event":
         """Create a DAEMON_STATUS event."""
-        return cls(
-            type=EventType.DAEMON_STATUS,
-            data=DaemonStatusEvent(
+        return cls._from_payload(
+            EventType.DAEMON_STATUS,
+            DaemonStatusEvent(
                 status=status,
                 uptime_seconds=uptime_seconds,
                 commands_processed=commands_processed,
                 active_connections=active_connections,
-            ).model_dump(),
+            ),
         )
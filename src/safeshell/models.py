@@ -2,21 +2,22 @@
 File: src/safeshell/models.py
 Purpose: Core Pydantic models for SafeShell data structures
 Exports: Decision, CommandContext, EvaluationResult, DaemonRequest, DaemonResponse
-Depends: pydantic, enum, time
+Depends: pydantic, collections, enum, time
 Overview: Defines all data models used for IPC between wrapper and daemon, and plugin evaluation
 """
 
 from __future__ import annotations
 
 import time
+from collections import OrderedDict
 from enum import Enum
 from pathlib import Path
 
 from pydantic import BaseModel, Field
 
 # Module-level git context cache for performance optimization
-# Key: working_dir -> (git_root, git_branch, timestamp)
-_git_context_cache: dict[str, tuple[str | None, str | None, float]] = {}
+# Key: working_dir -> (git_root, git_branch, timestamp), least recently used first
+_git_context_cache: OrderedDict[str, tuple[str | None, str | None, float]] = OrderedDict()
 _GIT_CONTEXT_CACHE_TTL = 10.0  # 10 seconds TTL
 _GIT_CONTEXT_CACHE_MAX_SIZE = 100  # Maximum cache entries
 
@@ -127,9 +128,11 @@ class CommandContext(BaseModel):
         now = time.monotonic()
 
         # Check cache first
-        if working_dir in _git_context_cache:
-            git_root, git_branch, timestamp = _git_context_cache[working_dir]
+        cached = _git_context_cache.get(working_dir)
+        if cached is not None:
+            git_root, git_branch, timestamp = cached
             if now - timestamp < _GIT_CONTEXT_CACHE_TTL:
+                _git_context_cache.move_to_end(working_dir)
                 return git_root, git_branch
             # Expired - remove it
             del _git_context_cache[working_dir]
@@ -195,15 +198,17 @@ class CommandContext(BaseModel):
 
     @staticmethod
     def _prune_git_context_cache() -> None:
-        """Remove oldest entries from git context cache."""
+        """Remove least recently used entries from git context cache.
+
+        The cache is kept in recency order, so the oldest 20% are popped
+        from the front without sorting.
+        """
         if not _git_context_cache:
             return
 
-        # Sort by timestamp, remove oldest 20%
-        sorted_items = sorted(_git_context_cache.items(), key=lambda x: x[1][2])
-        to_remove = max(1, len(sorted_items) // 5)
-        for key, _ in sorted_items[:to_remove]:
-            del _git_context_cache[key]
+        to_remove = max(1, len(_git_context_cache) // 5)
+        for _ in range(to_remove):
+            _git_context_cache.popitem(last=False)
 
 
 class EvaluationResult(BaseModel):
@@ -21,6 +21,22 @@ if TYPE_CHECKING:
 _ERROR_MSG_PREVIEW_LENGTH = 50
 
 
+def _compile_pattern(pattern: str) -> re.Pattern[str]:
+    """Compile a condition's regex pattern.
+
+    Each condition compiles its pattern once when it is built; ``re`` keeps its
+    own bounded cache for patterns that recur across rule reloads.
+
+    Raises:
+        ValueError: If pattern is not a valid regex (surfaces as a ValidationError
+            when raised during model construction)
+    """
+    try:
+        return re.compile(pattern)
+    except re.error as e:
+        raise ValueError(f"Invalid regex {pattern!r}: {e}") from e
+
+
 class CommandMatches(BaseModel):
     """Match command against regex pattern.
 
@@ -29,12 +45,14 @@ class CommandMatches(BaseModel):
     """
 
     command_matches: str = Field(description="Regex pattern to match against full command")
-    _compiled: re.Pattern[str] | None = PrivateAttr(default=None)
+    _compiled: re.Pattern[str] = PrivateAttr()
+
+    def model_post_init(self, context: Any, /) -> None:
+        """Compile the pattern once, at rule load time."""
+        self._compiled = _compile_pattern(self.command_matches)
 
     def evaluate(self, context: CommandContext) -> bool:
         """Check if command matches the regex pattern."""
-        if self._compiled is None:
-            self._compiled = re.compile(self.command_matches)
         return self._compiled.search(context.raw_command) is not None
 
 
@@ -74,15 +92,15 @@ class GitBranchIn(BaseModel):
     """
 
     git_branch_in: list[str] = Field(description="List of branch names to match")
-    _branch_set: set[str] | None = PrivateAttr(default=None)
+    _branch_set: frozenset[str] = PrivateAttr()
+
+    def model_post_init(self, context: Any, /) -> None:
+        """Build the branch lookup set once, at rule load time."""
+        self._branch_set = frozenset(self.git_branch_in)
 
     def evaluate(self, context: CommandContext) -> bool:
         """Check if current branch is in the list."""
-        if context.git_branch is None:
-            return False
-        if self._branch_set is None:
-            self._branch_set = set(self.git_branch_in)
-        return context.git_branch in self._branch_set
+        return context.git_branch is not None and context.git_branch in self._branch_set
 
 
 class GitBranchMatches(BaseModel):
@@ -93,14 +111,16 @@ class GitBranchMatches(BaseModel):
     """
 
     git_branch_matches: str = Field(description="Regex pattern to match against branch name")
-    _compiled: re.Pattern[str] | None = PrivateAttr(default=None)
+    _compiled: re.Pattern[str] = PrivateAttr()
+
+    def model_post_init(self, context: Any, /) -> None:
+        """Compile the pattern once, at rule load time."""
+        self._compiled = _compile_pattern(self.git_branch_matches)
 
     def evaluate(self, context: CommandContext) -> bool:
         """Check if branch name matches the regex pattern."""
         if context.git_branch is None:
             return False
-        if self._compiled is None:
-            self._compiled = re.compile(self.git_branch_matches)
         return self._compiled.search(context.git_branch) is not None
 
 
@@ -128,12 +148,14 @@ class PathMatches(BaseModel):
     """
 
     path_matches: str = Field(description="Regex pattern to match against working directory")
-    _compiled: re.Pattern[str] | None = PrivateAttr(default=None)
+    _compiled: re.Pattern[str] = PrivateAttr()
+
+    def model_post_init(self, context: Any, /) -> None:
+        """Compile the pattern once, at rule load time."""
+        self._compiled = _compile_pattern(self.path_matches)
 
     def evaluate(self, context: CommandContext) -> bool:
         """Check if working directory matches the pattern."""
-        if self._compiled is None:
-            self._compiled = re.compile(self.path_matches)
         return self._compiled.search(context.working_dir) is not None
 
 
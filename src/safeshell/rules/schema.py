@@ -9,7 +9,14 @@ Overview: Defines the schema for rules loaded from ~/.safeshell/rules.yaml and .
 from enum import Enum
 from typing import Any
 
-from pydantic import BaseModel, Field, field_validator, model_validator
+from pydantic import (
+    BaseModel,
+    Field,
+    ValidationError,
+    ValidationInfo,
+    field_validator,
+    model_validator,
+)
 
 from safeshell.rules.condition_types import Condition, parse_condition
 
@@ -80,11 +87,22 @@ class Rule(BaseModel):
 
     @field_validator("conditions", mode="before")
     @classmethod
-    def parse_conditions(cls, v: list[Any]) -> list[Condition]:
-        """Parse conditions from YAML format to Condition objects."""
+    def parse_conditions(cls, v: list[Any], info: ValidationInfo) -> list[Condition]:
+        """Parse conditions from YAML format to Condition objects.
+
+        Conditions are built (and their regexes compiled) here, so a bad
+        condition is reported with the name of the rule it belongs to.
+        """
         if not v:
             return []
-        return [parse_condition(item) if isinstance(item, dict) else item for item in v]
+        try:
+            return [parse_condition(item) if isinstance(item, dict) else item for item in v]
+        except ValidationError as e:
+            # Report the underlying error text rather than pydantic's "Value error, " form
+            details = "; ".join(
+                str(error.get("ctx", {}).get("error", error["msg"])) for error in e.errors()
+            )
+            raise ValueError(f"Rule {info.data.get('name')!r}: {details}") from e
 
     @model_validator(mode="after")
     def validate_redirect_to(self) -> "Rule":
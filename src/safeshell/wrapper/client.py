@@ -232,8 +232,7 @@ class DaemonClient:
 
         while True:
             response_data = self._recv_one(sock)
-            response_dict = json.loads(response_data.decode("utf-8"))
-            response = DaemonResponse.model_validate(response_dict)
+            response = DaemonResponse.model_validate_json(response_data)
 
             # Print status messages for intermediate responses
             if response.is_intermediate and response.status_message:
@@ -269,8 +268,8 @@ class DaemonClient:
                 sock.settimeout(socket_timeout)
                 sock.connect(str(self.socket_path))
 
-                # Send request as JSON line
-                message = request.model_dump_json().encode("utf-8") + b"\n"
+                # Send request as JSON line (same encoding as daemon.protocol.encode_message)
+                message = request.__pydantic_serializer__.to_json(request) + b"\n"
                 sock.sendall(message)
 
                 return self._receive_daemon_response(sock)
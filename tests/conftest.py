@@ -0,0 +1,36 @@
+"""Shared pytest configuration for the SafeShell test suite."""
+
+import os
+import shutil
+import tempfile
+from pathlib import Path
+
+import pytest
+
+# RAM-backed filesystem on Linux; absent on macOS
+_TMPFS_ROOT = Path("/dev/shm")  # noqa: S108
+
+# Key for the tmpfs basetemp this conftest created, so unconfigure can remove it
+_TMPFS_BASETEMP_KEY = pytest.StashKey[Path]()
+
+
+def pytest_configure(config: pytest.Config) -> None:
+    """Place pytest's temporary directories on tmpfs when available.
+
+    Fixtures create many small throwaway files (rule files, .git skeletons).
+    Only pytest's basetemp moves; tempfile calls elsewhere are unaffected.
+    An explicit TMPDIR or --basetemp still takes precedence.
+    """
+    if os.environ.get("TMPDIR") or config.option.basetemp:
+        return
+    if _TMPFS_ROOT.is_dir() and os.access(_TMPFS_ROOT, os.W_OK):
+        basetemp = Path(tempfile.mkdtemp(prefix="safeshell-pytest-", dir=_TMPFS_ROOT))
+        config.option.basetemp = str(basetemp)
+        config.stash[_TMPFS_BASETEMP_KEY] = basetemp
+
+
+def pytest_unconfigure(config: pytest.Config) -> None:
+    """Remove the tmpfs basetemp so runs don't accumulate in shared memory."""
+    basetemp = config.stash.get(_TMPFS_BASETEMP_KEY, None)
+    if basetemp is not None:
+        shutil.rmtree(basetemp, ignore_errors=True)
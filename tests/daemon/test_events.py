@@ -1,11 +1,15 @@
 """Tests for safeshell.daemon.events module."""
 
+import tempfile
+from unittest.mock import patch
+
 import pytest
 
 from safeshell.daemon.events import DaemonEventPublisher
+from safeshell.daemon.manager import RuleManager
 from safeshell.events.bus import EventBus
 from safeshell.events.types import Event, EventType
-from safeshell.models import Decision
+from safeshell.models import DaemonRequest, Decision, RequestType
 
 
 class TestDaemonEventPublisher:
@@ -194,6 +198,15 @@ class TestDaemonEventPublisher:
         count = await publisher.command_received("ls", "/home/user")
         assert count == 0
 
+    @pytest.mark.asyncio
+    async def test_no_subscribers_skips_event_construction(
+        self, publisher: DaemonEventPublisher
+    ) -> None:
+        """Test that no event is built when nobody is subscribed."""
+        with patch.object(Event, "command_received") as factory:
+            assert await publisher.command_received("ls", "/home/user") == 0
+        factory.assert_not_called()
+
 
 class TestEventPublisherWithManager:
     """Tests for RuleManager with event publisher integration."""
@@ -201,11 +214,6 @@ class TestEventPublisherWithManager:
     @pytest.mark.asyncio
     async def test_evaluate_emits_events(self) -> None:
         """Test that command evaluation emits events."""
-        import tempfile
-
-        from safeshell.daemon.manager import RuleManager
-        from safeshell.models import DaemonRequest, RequestType
-
         bus = EventBus()
         publisher = DaemonEventPublisher(bus)
         manager = RuleManager(event_publisher=publisher)
@@ -235,11 +243,6 @@ class TestEventPublisherWithManager:
     @pytest.mark.asyncio
     async def test_evaluate_without_publisher(self) -> None:
         """Test that evaluation works without event publisher."""
-        import tempfile
-
-        from safeshell.daemon.manager import RuleManager
-        from safeshell.models import DaemonRequest, Decision, RequestType
-
         manager = RuleManager()  # No publisher
 
         with tempfile.TemporaryDirectory() as tmpdir:
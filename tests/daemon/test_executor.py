@@ -1,9 +1,11 @@
 """Tests for daemon executor module."""
 
 import os
-import tempfile
+import shutil
 from pathlib import Path
 
+import pytest
+
 from safeshell.daemon.executor import ExecutionResult, execute_command
 
 
@@ -53,13 +55,13 @@ class TestExecuteCommand:
         assert result.exit_code == 0
         assert result.stderr.strip() == "error"
 
-    def test_command_with_working_dir(self) -> None:
+    def test_command_with_working_dir(self, tmp_path: Path) -> None:
         """Test executing a command in a specific working directory."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            result = execute_command("pwd", working_dir=tmpdir)
-            assert result.exit_code == 0
-            # Resolve symlinks for comparison (macOS /tmp -> /private/tmp)
-            assert os.path.realpath(result.stdout.strip()) == os.path.realpath(tmpdir)
+        # Resolve symlinks for comparison (macOS /tmp -> /private/tmp)
+        expected = os.path.realpath(tmp_path)
+        result = execute_command("pwd", working_dir=str(tmp_path))
+        assert result.exit_code == 0
+        assert os.path.realpath(result.stdout.strip()) == expected
 
     def test_command_with_env(self, tmp_path: Path) -> None:
         """Test executing a command with custom environment."""
@@ -73,10 +75,13 @@ class TestExecuteCommand:
 
     def test_command_inherits_path(self, tmp_path: Path) -> None:
         """Test that command inherits PATH from environment."""
-        # echo is a shell builtin, but ls should be found in PATH
-        result = execute_command("which ls", working_dir=str(tmp_path))
+        expected = shutil.which("ls")
+        if expected is None:
+            pytest.skip("ls not in PATH")
+        # `command -v` is a shell builtin, so only the shell itself is spawned
+        result = execute_command("command -v ls", working_dir=str(tmp_path))
         assert result.exit_code == 0
-        assert "/ls" in result.stdout
+        assert result.stdout.strip() == expected
 
     def test_invalid_working_dir(self) -> None:
         """Test executing a command in non-existent directory."""
@@ -0,0 +1,99 @@
+"""Tests for daemon lifecycle module."""
+
+import os
+import signal
+from pathlib import Path
+
+import pytest
+
+from safeshell.daemon.lifecycle import DaemonLifecycle
+
+
+class TestDaemonLifecyclePid:
+    """Tests for DaemonLifecycle PID file handling."""
+
+    def test_read_pid_missing_file(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test read_pid returns None when no PID file exists."""
+        monkeypatch.setattr(DaemonLifecycle, "pid_path", tmp_path / "daemon.pid")
+        assert DaemonLifecycle.read_pid() is None
+
+    def test_read_pid_valid(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test read_pid parses a valid PID file."""
+        pid_path = tmp_path / "daemon.pid"
+        pid_path.write_text("12345\n")
+        monkeypatch.setattr(DaemonLifecycle, "pid_path", pid_path)
+        assert DaemonLifecycle.read_pid() == 12345
+
+    def test_read_pid_invalid(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test read_pid returns None for a corrupt PID file."""
+        pid_path = tmp_path / "daemon.pid"
+        pid_path.write_text("not-a-pid")
+        monkeypatch.setattr(DaemonLifecycle, "pid_path", pid_path)
+        assert DaemonLifecycle.read_pid() is None
+
+    def test_write_pid(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test write_pid records the current process ID."""
+        monkeypatch.setattr(DaemonLifecycle, "pid_path", tmp_path / "daemon.pid")
+        monkeypatch.setattr(DaemonLifecycle, "ensure_directories", lambda: None)
+        DaemonLifecycle.write_pid()
+        assert DaemonLifecycle.read_pid() is not None
+
+
+class TestDaemonLifecycleIsRunning:
+    """Tests for DaemonLifecycle.is_running."""
+
+    def test_not_running_without_socket(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test is_running is False when the socket file is absent."""
+        monkeypatch.setattr(DaemonLifecycle, "socket_path", tmp_path / "daemon.sock")
+        assert DaemonLifecycle.is_running() is False
+
+    def test_stale_socket_cleaned_up(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test a socket file with no listener is removed."""
+        socket_path = tmp_path / "daemon.sock"
+        socket_path.touch()
+        monkeypatch.setattr(DaemonLifecycle, "socket_path", socket_path)
+        assert DaemonLifecycle.is_running() is False
+        assert not socket_path.exists()
+
+
+class TestStopDaemon:
+    """Tests for DaemonLifecycle.stop_daemon."""
+
+    def test_returns_false_without_pid(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test stop_daemon is a no-op when no PID file exists."""
+        monkeypatch.setattr(DaemonLifecycle, "pid_path", tmp_path / "daemon.pid")
+        assert DaemonLifecycle.stop_daemon() is False
+
+    def test_sends_sigterm(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test stop_daemon signals the daemon and removes its files."""
+        pid_path = tmp_path / "daemon.pid"
+        pid_path.write_text("12345")
+        calls: list[tuple[int, int]] = []
+        monkeypatch.setattr(os, "kill", lambda *args: calls.append(args))
+        monkeypatch.setattr(DaemonLifecycle, "pid_path", pid_path)
+        monkeypatch.setattr(DaemonLifecycle, "socket_path", tmp_path / "daemon.sock")
+
+        assert DaemonLifecycle.stop_daemon() is True
+        assert calls == [(12345, signal.SIGTERM)]
+        assert not pid_path.exists()
+
+    def test_returns_false_if_process_not_found(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test stop_daemon cleans up when the PID no longer exists."""
+        pid_path = tmp_path / "daemon.pid"
+        pid_path.write_text("12345")
+
+        def _raise_lookup(*_args: int) -> None:
+            raise ProcessLookupError
+
+        monkeypatch.setattr(os, "kill", _raise_lookup)
+        monkeypatch.setattr(DaemonLifecycle, "pid_path", pid_path)
+        monkeypatch.setattr(DaemonLifecycle, "socket_path", tmp_path / "daemon.sock")
+
+        assert DaemonLifecycle.stop_daemon() is False
+        assert not pid_path.exists()
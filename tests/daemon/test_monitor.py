@@ -1,14 +1,25 @@
 """Tests for safeshell.daemon.monitor module."""
 
+from typing import Any
+
 import pytest
 
 from safeshell.daemon.monitor import (
     MonitorCommand,
     MonitorCommandType,
     MonitorConnectionHandler,
+    MonitorEventMessage,
     MonitorResponse,
 )
+from safeshell.daemon.protocol import decode_message, encode_message
 from safeshell.events.bus import EventBus
+from safeshell.events.types import Event
+
+
+@pytest.fixture
+def bus() -> EventBus:
+    """Create a fresh EventBus for each handler test."""
+    return EventBus()
 
 
 class TestMonitorCommandType:
@@ -106,17 +117,25 @@ class TestMonitorResponse:
         assert data["error"] is None
 
 
+class TestMonitorEventMessage:
+    """Tests for MonitorEventMessage."""
+
+    def test_encodes_like_json_dump(self) -> None:
+        """Test the wire form matches the event's JSON-mode dump."""
+        event = Event.command_received("ls", "/home/user", client_pid=42)
+        msg = MonitorEventMessage.model_construct(event=event)
+        assert decode_message(encode_message(msg)) == {
+            "type": "event",
+            "event": event.model_dump(mode="json"),
+        }
+
+
 class TestMonitorConnectionHandler:
     """Tests for MonitorConnectionHandler class."""
 
-    @pytest.fixture
-    def bus(self) -> EventBus:
-        """Create an EventBus instance."""
-        return EventBus()
-
     @pytest.fixture
     def handler(self, bus: EventBus) -> MonitorConnectionHandler:
-        """Create a MonitorConnectionHandler instance."""
+        """Create a MonitorConnectionHandler instance on the test's bus."""
         return MonitorConnectionHandler(bus)
 
     def test_initial_state(self, handler: MonitorConnectionHandler) -> None:
@@ -131,25 +150,24 @@ class TestMonitorConnectionHandler:
         assert response.message == "pong"
 
     @pytest.mark.asyncio
-    async def test_process_approve_missing_id(self, handler: MonitorConnectionHandler) -> None:
-        """Test approve command without approval_id."""
-        response = await handler._process_command({"type": "approve"})
-        assert response.success is False
-        assert "approval_id" in response.error.lower()
-
-    @pytest.mark.asyncio
-    async def test_process_deny_missing_id(self, handler: MonitorConnectionHandler) -> None:
-        """Test deny command without approval_id."""
-        response = await handler._process_command({"type": "deny"})
-        assert response.success is False
-        assert "approval_id" in response.error.lower()
-
-    @pytest.mark.asyncio
-    async def test_process_invalid_command(self, handler: MonitorConnectionHandler) -> None:
-        """Test processing an invalid command."""
-        response = await handler._process_command({"type": "invalid"})
+    @pytest.mark.parametrize(
+        ("command", "expected_error"),
+        [
+            ({"type": "approve"}, "approval_id"),
+            ({"type": "deny"}, "approval_id"),
+            ({"type": "invalid"}, "invalid command"),
+            ([1, 2], "invalid command"),
+        ],
+        ids=["approve-missing-id", "deny-missing-id", "invalid-type", "not-an-object"],
+    )
+    async def test_process_rejected_command(
+        self, handler: MonitorConnectionHandler, command: Any, expected_error: str
+    ) -> None:
+        """Test malformed commands produce an error response."""
+        response = await handler._process_command(command)
         assert response.success is False
         assert response.error is not None
+        assert expected_error in response.error.lower()
 
     @pytest.mark.asyncio
     async def test_approve_without_callback(self, handler: MonitorConnectionHandler) -> None:
@@ -163,6 +181,14 @@ class TestMonitorConnectionHandler:
         assert response.success is False
         assert "not configured" in response.error.lower()
 
+    @pytest.mark.asyncio
+    async def test_approve_with_cleared_callbacks(self, handler: MonitorConnectionHandler) -> None:
+        """Test approve after callbacks are reset to None reports not configured."""
+        handler.set_approval_callbacks(None, None)
+        response = await handler._process_command({"type": "approve", "approval_id": "test123"})
+        assert response.success is False
+        assert "not configured" in response.error.lower()
+
     @pytest.mark.asyncio
     async def test_deny_without_callback(self, handler: MonitorConnectionHandler) -> None:
         """Test deny when no callback is set."""
@@ -176,36 +202,35 @@ class TestMonitorConnectionHandler:
         assert "not configured" in response.error.lower()
 
     @pytest.mark.asyncio
-    async def test_approve_with_callback(self, handler: MonitorConnectionHandler) -> None:
-        """Test approve with callback set."""
-        approved_ids: list[tuple[str, bool]] = []
-
-        async def approve_callback(approval_id: str, remember: bool = False) -> None:
-            approved_ids.append((approval_id, remember))
-
-        async def deny_callback(
-            approval_id: str, reason: str | None, remember: bool = False
-        ) -> None:
-            pass
-
-        handler.set_approval_callbacks(approve_callback, deny_callback)
-
-        response = await handler._process_command(
-            {
-                "type": "approve",
-                "approval_id": "test123",
-            }
-        )
-        assert response.success is True
-        assert ("test123", False) in approved_ids
-
-    @pytest.mark.asyncio
-    async def test_deny_with_callback(self, handler: MonitorConnectionHandler) -> None:
-        """Test deny with callback set."""
+    @pytest.mark.parametrize(
+        ("command", "expected_approved", "expected_denied"),
+        [
+            (
+                {"type": "approve", "approval_id": "test123"},
+                [("test123", False)],
+                [],
+            ),
+            (
+                {"type": "deny", "approval_id": "test123", "reason": "Too risky"},
+                [],
+                [("test123", "Too risky", False)],
+            ),
+        ],
+        ids=["approve", "deny"],
+    )
+    async def test_decision_with_callback(
+        self,
+        handler: MonitorConnectionHandler,
+        command: dict[str, str],
+        expected_approved: list[tuple[str, bool]],
+        expected_denied: list[tuple[str, str | None, bool]],
+    ) -> None:
+        """Test approve/deny commands reach the matching callback."""
+        approved: list[tuple[str, bool]] = []
         denied: list[tuple[str, str | None, bool]] = []
 
         async def approve_callback(approval_id: str, remember: bool = False) -> None:
-            pass
+            approved.append((approval_id, remember))
 
         async def deny_callback(
             approval_id: str, reason: str | None, remember: bool = False
@@ -214,12 +239,7 @@ class TestMonitorConnectionHandler:
 
         handler.set_approval_callbacks(approve_callback, deny_callback)
 
-        response = await handler._process_command(
-            {
-                "type": "deny",
-                "approval_id": "test123",
-                "reason": "Too risky",
-            }
-        )
+        response = await handler._process_command(command)
         assert response.success is True
-        assert ("test123", "Too risky", False) in denied
+        assert approved == expected_approved
+        assert denied == expected_denied
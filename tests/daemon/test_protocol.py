@@ -1,14 +1,22 @@
 """Tests for safeshell.daemon.protocol module."""
 
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
 import pytest
 
 from safeshell.daemon.protocol import (
     decode_message,
     encode_message,
+    read_message,
+    write_message,
 )
 from safeshell.exceptions import ProtocolError
 from safeshell.models import DaemonRequest, DaemonResponse, RequestType
 
+# Ping payload shared by the decode and read tests
+_PING_JSON = b'{"type": "ping"}'
+
 
 class TestEncodeMessage:
     """Tests for encode_message function."""
@@ -42,8 +50,7 @@ class TestDecodeMessage:
 
     def test_decode_valid_json(self) -> None:
         """Test decoding valid JSON."""
-        data = b'{"type": "ping"}'
-        result = decode_message(data)
+        result = decode_message(_PING_JSON)
         assert result == {"type": "ping"}
 
     def test_decode_complex_json(self) -> None:
@@ -54,15 +61,15 @@ class TestDecodeMessage:
         assert result["command"] == "ls"
         assert result["env"]["USER"] == "test"
 
-    def test_decode_invalid_json(self) -> None:
-        """Test decoding invalid JSON raises ProtocolError."""
-        with pytest.raises(ProtocolError):
-            decode_message(b"not valid json")
-
-    def test_decode_invalid_utf8(self) -> None:
-        """Test decoding invalid UTF-8 raises ProtocolError."""
+    @pytest.mark.parametrize(
+        "data",
+        [b"not valid json", b"\xff\xfe", b"", b"{"],
+        ids=["invalid-json", "invalid-utf8", "empty", "truncated"],
+    )
+    def test_decode_invalid(self, data: bytes) -> None:
+        """Test decoding malformed input raises ProtocolError."""
         with pytest.raises(ProtocolError):
-            decode_message(b"\xff\xfe")
+            decode_message(data)
 
 
 class TestRoundTrip:
@@ -81,10 +88,7 @@ class TestRoundTrip:
 
         # Validate decoded matches original
         reconstructed = DaemonRequest.model_validate(decoded)
-        assert reconstructed.type == original.type
-        assert reconstructed.command == original.command
-        assert reconstructed.working_dir == original.working_dir
-        assert reconstructed.env == original.env
+        assert reconstructed.model_dump() == original.model_dump()
 
     def test_response_roundtrip(self) -> None:
         """Test encoding then decoding a response."""
@@ -93,7 +97,58 @@ class TestRoundTrip:
         decoded = decode_message(encoded.strip())
 
         reconstructed = DaemonResponse.model_validate(decoded)
-        assert reconstructed.success == original.success
-        assert reconstructed.final_decision == original.final_decision
-        assert reconstructed.should_execute == original.should_execute
-        assert reconstructed.denial_message == original.denial_message
+        assert reconstructed.model_dump() == original.model_dump()
+
+
+class _FakeReader:
+    """Minimal stand-in for asyncio.StreamReader.readline."""
+
+    def __init__(self, data: bytes = b"", exc: BaseException | None = None) -> None:
+        self._data = data
+        self._exc = exc
+
+    async def readline(self) -> bytes:
+        if self._exc is not None:
+            raise self._exc
+        return self._data
+
+
+class TestReadMessage:
+    """Tests for read_message function."""
+
+    @pytest.mark.asyncio
+    async def test_read_valid_message(self) -> None:
+        """Test reading a newline-terminated JSON message."""
+        reader = _FakeReader(data=_PING_JSON + b"\n")
+        result = await read_message(reader)
+        assert result == {"type": "ping"}
+
+    @pytest.mark.asyncio
+    async def test_read_connection_closed(self) -> None:
+        """Test reading from a closed connection raises ProtocolError."""
+        reader = _FakeReader(data=b"")
+        with pytest.raises(ProtocolError, match="closed"):
+            await read_message(reader)
+
+    @pytest.mark.asyncio
+    async def test_read_incomplete(self) -> None:
+        """Test an incomplete read raises ProtocolError."""
+        reader = _FakeReader(exc=asyncio.IncompleteReadError(partial=b"{", expected=10))
+        with pytest.raises(ProtocolError, match="Incomplete"):
+            await read_message(reader)
+
+
+class TestWriteMessage:
+    """Tests for write_message function."""
+
+    @pytest.mark.asyncio
+    async def test_write_message(self) -> None:
+        """Test writing encodes the model and drains the writer."""
+        mock_writer = MagicMock()
+        mock_writer.drain = AsyncMock()
+        response = DaemonResponse.allow()
+
+        await write_message(mock_writer, response)
+
+        mock_writer.write.assert_called_once_with(encode_message(response))
+        mock_writer.drain.assert_awaited_once()
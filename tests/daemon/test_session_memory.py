@@ -2,6 +2,7 @@
 
 from unittest.mock import patch
 
+from safeshell.daemon import session_memory
 from safeshell.daemon.session_memory import ApprovalMemoryKey, SessionMemory
 
 
@@ -33,6 +34,14 @@ class TestApprovalMemoryKey:
         assert key1 == key2
         assert key1 != key3
 
+    def test_intern_returns_shared_instance(self) -> None:
+        """Test interned keys are reused while referenced."""
+        key1 = ApprovalMemoryKey.intern("git-protect", "git")
+        key2 = ApprovalMemoryKey.intern("git-protect", "git")
+        assert key1 is key2
+        assert key1 == ApprovalMemoryKey(rule_name="git-protect", base_command="git")
+        assert hash(key1) == hash(ApprovalMemoryKey(rule_name="git-protect", base_command="git"))
+
 
 class TestSessionMemory:
     """Tests for SessionMemory."""
@@ -64,6 +73,32 @@ class TestSessionMemory:
         # Same rule + same base command should match
         assert memory.is_pre_approved("git-protect", "git pull origin main")
 
+    def test_base_command_ignores_surrounding_whitespace(self) -> None:
+        """Test the executable is found past leading whitespace and tabs."""
+        memory = SessionMemory()
+        memory.remember_approval("git-protect", "  git\tpush")
+        assert memory.is_pre_approved("git-protect", "git status")
+
+    def test_whitespace_only_command(self) -> None:
+        """Test a blank command maps to an empty base command."""
+        memory = SessionMemory()
+        memory.remember_approval("rule", "   ")
+        assert memory.is_pre_approved("rule", "")
+
+    def test_lookup_miss_creates_nothing(self) -> None:
+        """Test a lookup miss neither interns a key nor adds an entry."""
+        memory = SessionMemory()
+        memory.remember_approval("git-protect", "git push")
+        interned_before = dict(session_memory._INTERNED_KEYS)
+        entries_before = dict(memory._entries)
+
+        assert not memory.is_pre_approved("unseen-rule", "rm -rf /tmp/x")
+        assert not memory.is_pre_denied("unseen-rule", "rm -rf /tmp/x")
+        assert memory.get_approval_remaining_seconds("unseen-rule", "rm") is None
+
+        assert dict(session_memory._INTERNED_KEYS) == interned_before
+        assert memory._entries == entries_before
+
     def test_different_rules_tracked_separately(self) -> None:
         """Test that different rules are tracked separately."""
         memory = SessionMemory()
@@ -123,15 +158,15 @@ class TestSessionMemoryTTL:
 
         # Record the approval at a known time
         base_time = 1000.0
-        with patch("safeshell.daemon.session_memory.time.time", return_value=base_time):
+        with patch("safeshell.daemon.session_memory.time.monotonic", return_value=base_time):
             memory.remember_approval("git-protect", "git push")
 
         # Check immediately after - should be approved
-        with patch("safeshell.daemon.session_memory.time.time", return_value=base_time + 1):
+        with patch("safeshell.daemon.session_memory.time.monotonic", return_value=base_time + 1):
             assert memory.is_pre_approved("git-protect", "git push")
 
         # Check after TTL expires - should NOT be approved
-        with patch("safeshell.daemon.session_memory.time.time", return_value=base_time + 61):
+        with patch("safeshell.daemon.session_memory.time.monotonic", return_value=base_time + 61):
             assert not memory.is_pre_approved("git-protect", "git push")
 
     def test_denial_expires_after_ttl(self) -> None:
@@ -139,15 +174,15 @@ class TestSessionMemoryTTL:
         memory = SessionMemory(ttl_seconds=60)
 
         base_time = 1000.0
-        with patch("safeshell.daemon.session_memory.time.time", return_value=base_time):
+        with patch("safeshell.daemon.session_memory.time.monotonic", return_value=base_time):
             memory.remember_denial("git-protect", "git push")
 
         # Check immediately after - should be denied
-        with patch("safeshell.daemon.session_memory.time.time", return_value=base_time + 1):
+        with patch("safeshell.daemon.session_memory.time.monotonic", return_value=base_time + 1):
             assert memory.is_pre_denied("git-protect", "git push")
 
         # Check after TTL expires - should NOT be denied
-        with patch("safeshell.daemon.session_memory.time.time", return_value=base_time + 61):
+        with patch("safeshell.daemon.session_memory.time.monotonic", return_value=base_time + 61):
             assert not memory.is_pre_denied("git-protect", "git push")
 
     def test_zero_ttl_means_no_expiry(self) -> None:
@@ -156,18 +191,19 @@ class TestSessionMemoryTTL:
         memory.remember_approval("git-protect", "git push")
 
         # Even with time far in the future, should still be approved (TTL=0 means no expiry)
-        assert memory.is_pre_approved("git-protect", "git push")
+        with patch("safeshell.daemon.session_memory.time.monotonic", return_value=1e12):
+            assert memory.is_pre_approved("git-protect", "git push")
 
     def test_approval_within_ttl(self) -> None:
         """Test that approval is valid within TTL."""
         memory = SessionMemory(ttl_seconds=60)
 
         base_time = 1000.0
-        with patch("safeshell.daemon.session_memory.time.time", return_value=base_time):
+        with patch("safeshell.daemon.session_memory.time.monotonic", return_value=base_time):
             memory.remember_approval("git-protect", "git push")
 
         # 30 seconds later should still be approved
-        with patch("safeshell.daemon.session_memory.time.time", return_value=base_time + 30):
+        with patch("safeshell.daemon.session_memory.time.monotonic", return_value=base_time + 30):
             assert memory.is_pre_approved("git-protect", "git push")
 
     def test_expired_entry_removed_from_cache(self) -> None:
@@ -175,12 +211,58 @@ class TestSessionMemoryTTL:
         memory = SessionMemory(ttl_seconds=60)
 
         base_time = 1000.0
-        with patch("safeshell.daemon.session_memory.time.time", return_value=base_time):
+        with patch("safeshell.daemon.session_memory.time.monotonic", return_value=base_time):
             memory.remember_approval("git-protect", "git push")
-        assert memory.stats["approved_count"] == 1
+            assert memory.stats["approved_count"] == 1
 
         # Check after TTL expires - entry should be removed
-        with patch("safeshell.daemon.session_memory.time.time", return_value=base_time + 61):
-            memory.is_pre_approved("git-protect", "git push")
-            # Entry should be removed
+        with patch("safeshell.daemon.session_memory.time.monotonic", return_value=base_time + 61):
+            assert not memory.is_pre_approved("git-protect", "git push")
+            # Entry should be removed by the lookup, leaving nothing to purge
+            assert memory.purge_expired() == 0
             assert memory.stats["approved_count"] == 0
+
+    def test_stats_excludes_expired_entries(self) -> None:
+        """Test stats purges entries that expired without being looked up."""
+        memory = SessionMemory(ttl_seconds=60)
+
+        base_time = 1000.0
+        with patch("safeshell.daemon.session_memory.time.monotonic", return_value=base_time):
+            memory.remember_approval("rule1", "cmd1")
+            memory.remember_denial("rule2", "cmd2")
+        with patch("safeshell.daemon.session_memory.time.monotonic", return_value=base_time + 30):
+            memory.remember_approval("rule3", "cmd3")
+
+        with patch("safeshell.daemon.session_memory.time.monotonic", return_value=base_time + 61):
+            assert memory.stats["approved_count"] == 1
+            assert memory.stats["denied_count"] == 0
+
+    def test_purge_skips_overwritten_entries(self) -> None:
+        """Test a refreshed entry is not purged at its earlier deadline."""
+        memory = SessionMemory(ttl_seconds=60)
+
+        base_time = 1000.0
+        with patch("safeshell.daemon.session_memory.time.monotonic", return_value=base_time):
+            memory.remember_denial("git-protect", "git push")
+        with patch("safeshell.daemon.session_memory.time.monotonic", return_value=base_time + 30):
+            memory.remember_approval("git-protect", "git push")
+
+        assert memory.purge_expired(now=base_time + 61) == 0
+        assert memory.purge_expired(now=base_time + 91) == 1
+
+    def test_lookups_purge_in_batches(self) -> None:
+        """Test expired entries are left for the next batched purge."""
+        memory = SessionMemory(ttl_seconds=5)  # purge at most every 0.5s
+
+        base_time = 1000.0
+        with patch("safeshell.daemon.session_memory.time.monotonic", return_value=base_time):
+            memory.remember_approval("git-protect", "git push")
+
+        # This lookup runs a purge, starting the interval
+        with patch("safeshell.daemon.session_memory.time.monotonic", return_value=base_time + 4.9):
+            assert memory.is_pre_approved("git-protect", "git push")
+
+        # Expired, but within the purge interval: reported as expired, not yet removed
+        with patch("safeshell.daemon.session_memory.time.monotonic", return_value=base_time + 5.2):
+            assert not memory.is_pre_approved("git-protect", "git push")
+        assert memory.purge_expired(now=base_time + 5.2) == 1
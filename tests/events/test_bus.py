@@ -1,6 +1,8 @@
 """Tests for safeshell.events.bus module."""
 
 import asyncio
+import time
+from collections.abc import Awaitable, Callable
 
 import pytest
 
@@ -118,6 +120,39 @@ class TestEventBus:
         assert delivered == 1
         assert len(received) == 1
 
+    @pytest.mark.asyncio
+    async def test_sync_raising_callback_does_not_affect_others(self) -> None:
+        """Test a callback that raises before returning a coroutine is isolated."""
+        bus = EventBus()
+        received: list[Event] = []
+
+        def raising_handler(event: Event) -> Awaitable[None]:
+            raise RuntimeError("Raised synchronously")
+
+        async def working_handler(event: Event) -> None:
+            received.append(event)
+
+        await bus.subscribe(raising_handler)
+        await bus.subscribe(working_handler)
+
+        delivered = await bus.publish(Event.command_received("test", "/home/user"))
+
+        assert delivered == 1
+        assert len(received) == 1
+
+    @pytest.mark.asyncio
+    async def test_subscriber_cancellation_propagates(self) -> None:
+        """Test a subscriber's cancellation is not swallowed as a delivery error."""
+        bus = EventBus()
+
+        async def cancelled_handler(event: Event) -> None:
+            raise asyncio.CancelledError
+
+        await bus.subscribe(cancelled_handler)
+
+        with pytest.raises(asyncio.CancelledError):
+            await bus.publish(Event.command_received("test", "/home/user"))
+
     @pytest.mark.asyncio
     async def test_subscriber_count(self) -> None:
         """Test subscriber_count property."""
@@ -180,8 +215,6 @@ class TestEventBus:
         call_times: list[float] = []
 
         async def slow_handler(event: Event) -> None:
-            import time
-
             start = time.monotonic()
             await asyncio.sleep(0.01)  # 10ms delay
             call_times.append(time.monotonic() - start)
@@ -191,8 +224,6 @@ class TestEventBus:
         await bus.subscribe(slow_handler)
         await bus.subscribe(slow_handler)
 
-        import time
-
         start = time.monotonic()
         event = Event.command_received("test", "/home/user")
         await bus.publish(event)
@@ -247,3 +278,73 @@ class TestEventBus:
         assert received[1].type == EventType.EVALUATION_STARTED
         assert received[2].type == EventType.EVALUATION_COMPLETED
         assert received[3].type == EventType.DAEMON_STATUS
+
+    @pytest.mark.asyncio
+    async def test_subscribe_after_publish_receives_next_event(self) -> None:
+        """Test that subscribers added between publishes are delivered to."""
+        bus = EventBus()
+        received: list[Event] = []
+
+        async def handler(event: Event) -> None:
+            received.append(event)
+
+        first_id = await bus.subscribe(handler)
+        assert await bus.publish(Event.command_received("ls", "/home/user")) == 1
+
+        await bus.subscribe(handler)
+        assert await bus.publish(Event.command_received("ls", "/home/user")) == 2
+
+        await bus.unsubscribe(first_id)
+        assert await bus.publish(Event.command_received("ls", "/home/user")) == 1
+        assert len(received) == 4
+
+    @pytest.mark.asyncio
+    async def test_unsubscribe_middle_keeps_others(self) -> None:
+        """Test removing a subscriber from the middle leaves the rest reachable."""
+        bus = EventBus()
+        received: list[str] = []
+
+        def make_handler(name: str) -> Callable[[Event], Awaitable[None]]:
+            async def handler(event: Event) -> None:
+                received.append(name)
+
+            return handler
+
+        sub_ids = [await bus.subscribe(make_handler(name)) for name in ("a", "b", "c")]
+        assert await bus.unsubscribe(sub_ids[0]) is True
+
+        assert sorted(bus.get_subscriber_ids()) == sorted(sub_ids[1:])
+        assert await bus.publish(Event.command_received("ls", "/home/user")) == 2
+        assert sorted(received) == ["b", "c"]
+
+        # The moved subscriber can still be removed by its ID
+        assert await bus.unsubscribe(sub_ids[2]) is True
+        assert bus.get_subscriber_ids() == [sub_ids[1]]
+
+    @pytest.mark.asyncio
+    async def test_subscription_ids_not_reused(self) -> None:
+        """Test that IDs stay unique after subscribers are removed."""
+        bus = EventBus()
+
+        async def handler(event: Event) -> None:
+            pass
+
+        first = await bus.subscribe(handler)
+        await bus.unsubscribe(first)
+        second = await bus.subscribe(handler)
+        assert second != first
+
+    @pytest.mark.asyncio
+    async def test_truthiness_tracks_subscribers(self) -> None:
+        """Test bool(bus) reflects whether anyone listens."""
+        bus = EventBus()
+        assert not bus
+
+        async def handler(event: Event) -> None:
+            pass
+
+        sub_id = await bus.subscribe(handler)
+        assert bus
+
+        await bus.unsubscribe(sub_id)
+        assert not bus
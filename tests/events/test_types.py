@@ -1,6 +1,7 @@
 """Tests for safeshell.events.types module."""
 
 from datetime import UTC, datetime
+from unittest.mock import patch
 
 from safeshell.events.types import (
     ApprovalNeededEvent,
@@ -183,6 +184,13 @@ class TestEvent:
         )
         assert event.timestamp.tzinfo == UTC
 
+    def test_timestamp_uses_module_clock(self) -> None:
+        """Test factories and the default timestamp read the swappable _now clock."""
+        fixed = datetime(2024, 1, 2, 3, 4, 5, tzinfo=UTC)
+        with patch("safeshell.events.types._now", return_value=fixed):
+            assert Event.command_received("ls", "/home/user").timestamp == fixed
+            assert Event(type=EventType.DAEMON_STATUS, data={}).timestamp == fixed
+
     def test_command_received_factory(self) -> None:
         """Test Event.command_received() factory."""
         event = Event.command_received("git status", "/home/user/project")
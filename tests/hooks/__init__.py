@@ -0,0 +1 @@
+"""Hooks tests package."""
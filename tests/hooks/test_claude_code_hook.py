@@ -0,0 +1,242 @@
+"""Tests for safeshell.hooks.claude_code_hook module."""
+
+import os
+import subprocess
+from collections.abc import Callable, Iterator
+from io import StringIO
+from pathlib import Path
+from types import SimpleNamespace
+from typing import Any
+from unittest.mock import patch
+
+import pytest
+
+from safeshell.hooks import claude_code_hook
+
+# Hook stdin payloads, serialized once
+_BASH_RM_JSON = '{"tool_name": "Bash", "tool_input": {"command": "rm -rf /"}}'
+_BASH_ECHO_JSON = '{"tool_name": "Bash", "tool_input": {"command": "echo hello"}}'
+_READ_JSON = '{"tool_name": "Read", "tool_input": {"file_path": "/etc/passwd"}}'
+_BASH_EMPTY_JSON = '{"tool_name": "Bash", "tool_input": {"command": ""}}'
+_BASH_NO_INPUT_JSON = '{"tool_name": "Bash"}'
+_BASH_EMPTY_INPUT_JSON = '{"tool_name": "Bash", "tool_input": {}}'
+_INVALID_JSON = "not json"
+
+
+@pytest.fixture(scope="class")
+def fake_socket(tmp_path_factory: pytest.TempPathFactory) -> Iterator[Path]:
+    """Create one daemon socket file per class and point SAFESHELL_SOCKET at it."""
+    socket_path = tmp_path_factory.mktemp("sock") / "daemon.sock"
+    socket_path.touch()
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setenv("SAFESHELL_SOCKET", str(socket_path))
+        yield socket_path
+
+
+def _make_exec(path: Path, mode: int = 0o755) -> None:
+    """Create an empty file with the given mode."""
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, mode)
+    try:
+        os.fchmod(fd, mode)  # The umask may have masked bits at creation
+    finally:
+        os.close(fd)
+
+
+def _raise(exc: BaseException) -> Callable[..., Any]:
+    """Build a fake subprocess.run that raises exc."""
+
+    def run(*_args: Any, **_kwargs: Any) -> Any:
+        raise exc
+
+    return run
+
+
+class TestFindWrapper:
+    """Tests for find_wrapper function."""
+
+    def test_finds_wrapper_in_path(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test finding an executable wrapper on PATH."""
+        wrapper = tmp_path / "safeshell-wrapper"
+        _make_exec(wrapper)
+        monkeypatch.setenv("PATH", str(tmp_path))
+
+        assert claude_code_hook.find_wrapper() == str(wrapper)
+
+    def test_finds_wrapper_in_local_bin(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test falling back to ~/.local/bin when PATH has no wrapper."""
+        home_dir = tmp_path / "home"
+        local_bin = home_dir / ".local/bin"
+        local_bin.mkdir(parents=True)
+        wrapper = local_bin / "safeshell-wrapper"
+        _make_exec(wrapper)
+        monkeypatch.setenv("PATH", str(tmp_path))
+        monkeypatch.setattr(Path, "home", lambda: home_dir)
+
+        assert claude_code_hook.find_wrapper() == str(wrapper)
+
+    def test_returns_none_when_not_found(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test None is returned when no wrapper is installed."""
+        monkeypatch.setenv("PATH", str(tmp_path))
+        monkeypatch.setattr(Path, "home", lambda: tmp_path)
+        monkeypatch.setattr(Path, "is_file", lambda _self: False)
+
+        assert claude_code_hook.find_wrapper() is None
+
+    def test_skips_non_executable_files(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test a wrapper without the executable bit is ignored."""
+        wrapper = tmp_path / "safeshell-wrapper"
+        _make_exec(wrapper, 0o644)
+        monkeypatch.setenv("PATH", str(tmp_path))
+        monkeypatch.setattr(Path, "home", lambda: tmp_path)
+
+        assert claude_code_hook.find_wrapper() is None
+
+
+class TestCheckCommand:
+    """Tests for check_command function."""
+
+    def test_returns_allowed_when_wrapper_not_found(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test fail-open when the wrapper is missing."""
+        monkeypatch.setattr(claude_code_hook, "find_wrapper", lambda: None)
+
+        allowed, message = claude_code_hook.check_command("ls")
+        assert allowed is True
+        assert "not found" in message
+
+    def test_returns_allowed_when_daemon_not_running(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Test fail-open when the daemon socket does not exist."""
+        monkeypatch.setattr(claude_code_hook, "find_wrapper", lambda: "/bin/wrapper")
+        monkeypatch.setenv("SAFESHELL_SOCKET", "/nonexistent/daemon.sock")
+
+        allowed, message = claude_code_hook.check_command("ls")
+        assert allowed is True
+        assert "not running" in message
+
+    def test_returns_allowed_when_command_allowed(
+        self, fake_socket: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test an allowed command passes through the wrapper's stderr."""
+        mock_result = SimpleNamespace(returncode=0, stderr="Approved by user\n")
+        monkeypatch.setattr(subprocess, "run", lambda *_args, **_kwargs: mock_result)
+        monkeypatch.setattr(claude_code_hook, "find_wrapper", lambda: "/bin/wrapper")
+
+        allowed, message = claude_code_hook.check_command("ls")
+        assert allowed is True
+        assert message == "Approved by user"
+
+    def test_returns_blocked_when_command_denied(
+        self, fake_socket: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test a non-zero wrapper exit blocks the command."""
+        mock_result = SimpleNamespace(returncode=1, stderr="Blocked: force push\n")
+        monkeypatch.setattr(subprocess, "run", lambda *_args, **_kwargs: mock_result)
+        monkeypatch.setattr(claude_code_hook, "find_wrapper", lambda: "/bin/wrapper")
+
+        allowed, message = claude_code_hook.check_command("git push --force")
+        assert allowed is False
+        assert message == "Blocked: force push"
+
+    def test_blocked_without_stderr_uses_default_message(
+        self, fake_socket: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test a generic message is used when the wrapper prints nothing."""
+        mock_result = SimpleNamespace(returncode=1, stderr="")
+        monkeypatch.setattr(subprocess, "run", lambda *_args, **_kwargs: mock_result)
+        monkeypatch.setattr(claude_code_hook, "find_wrapper", lambda: "/bin/wrapper")
+
+        allowed, message = claude_code_hook.check_command("rm -rf /")
+        assert allowed is False
+        assert message == "Command blocked by SafeShell"
+
+    def test_sets_check_only_and_ai_context(
+        self, fake_socket: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test the wrapper runs in check-only mode with AI context."""
+        captured: dict[str, object] = {}
+
+        def capture_run(cmd: list[str], **kwargs: object) -> SimpleNamespace:
+            captured["cmd"] = cmd
+            captured["env"] = kwargs["env"]
+            return SimpleNamespace(returncode=0, stderr="")
+
+        monkeypatch.setattr(subprocess, "run", capture_run)
+        monkeypatch.setattr(claude_code_hook, "find_wrapper", lambda: "/bin/wrapper")
+
+        claude_code_hook.check_command("ls -la")
+
+        assert captured["cmd"] == ["/bin/wrapper", "-c", "ls -la"]
+        env = captured["env"]
+        assert isinstance(env, dict)
+        assert env["SAFESHELL_CHECK_ONLY"] == "1"
+        assert env["SAFESHELL_CONTEXT"] == "ai"
+
+    def test_returns_blocked_on_timeout(
+        self, fake_socket: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test an approval timeout blocks the command."""
+        monkeypatch.setattr(
+            subprocess, "run", _raise(subprocess.TimeoutExpired(cmd="wrapper", timeout=1))
+        )
+        monkeypatch.setattr(claude_code_hook, "find_wrapper", lambda: "/bin/wrapper")
+
+        allowed, message = claude_code_hook.check_command("git push")
+        assert allowed is False
+        assert "timed out" in message
+
+    def test_returns_allowed_on_unexpected_error(
+        self, fake_socket: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test fail-open when running the wrapper raises."""
+        monkeypatch.setattr(subprocess, "run", _raise(OSError("exec failed")))
+        monkeypatch.setattr(claude_code_hook, "find_wrapper", lambda: "/bin/wrapper")
+
+        allowed, message = claude_code_hook.check_command("ls")
+        assert allowed is True
+        assert "exec failed" in message
+
+
+class TestMain:
+    """Tests for the hook's main entry point."""
+
+    @pytest.mark.parametrize(
+        ("payload", "check_return", "expected_rc"),
+        [
+            pytest.param(_READ_JSON, None, 0, id="non-bash-tool"),
+            pytest.param(_BASH_EMPTY_JSON, None, 0, id="empty-command"),
+            pytest.param(_BASH_NO_INPUT_JSON, None, 0, id="missing-tool-input"),
+            pytest.param(_BASH_EMPTY_INPUT_JSON, None, 0, id="empty-tool-input"),
+            pytest.param(_INVALID_JSON, None, 0, id="invalid-json"),
+            pytest.param(_BASH_ECHO_JSON, (True, ""), 0, id="allowed"),
+            pytest.param(_BASH_RM_JSON, (False, "Blocked"), 2, id="blocked"),
+        ],
+    )
+    def test_return_code(
+        self, payload: str, check_return: tuple[bool, str] | None, expected_rc: int
+    ) -> None:
+        """Test main's exit code; None means the daemon must not be consulted."""
+        with (
+            patch("sys.stdin", StringIO(payload)),
+            patch.object(claude_code_hook, "check_command", return_value=check_return) as check,
+        ):
+            assert claude_code_hook.main() == expected_rc
+        assert check.called is (check_return is not None)
+
+    def test_prints_block_message_to_stderr(self, capsys: pytest.CaptureFixture[str]) -> None:
+        """Test the block message is shown to the agent on stderr."""
+        with (
+            patch("sys.stdin", StringIO(_BASH_RM_JSON)),
+            patch.object(
+                claude_code_hook, "check_command", return_value=(False, "Custom block message")
+            ),
+        ):
+            claude_code_hook.main()
+
+        captured = capsys.readouterr()
+        assert "Custom block message" in captured.err
+        assert captured.out == ""
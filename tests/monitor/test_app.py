@@ -3,8 +3,6 @@ File: tests/monitor/test_app.py
 Purpose: Tests for MonitorApp
 """
 
-import pytest
-
 from safeshell.monitor.app import MonitorApp
 
 
@@ -13,30 +11,19 @@ class TestMonitorApp:
 
     def test_app_title(self) -> None:
         """Test the app has correct title."""
-        app = MonitorApp()
-        assert app.TITLE == "SafeShell Monitor"
+        assert MonitorApp.TITLE == "SafeShell Monitor"
 
     def test_app_bindings(self) -> None:
         """Test the app has correct key bindings."""
-        app = MonitorApp()
-
-        # Check that expected bindings exist
-        binding_keys = [b.key for b in app.BINDINGS]
-        assert "ctrl+q" in binding_keys
-        assert "1" in binding_keys
-        assert "2" in binding_keys
-        assert "3" in binding_keys
-        assert "4" in binding_keys
-        assert "ctrl+r" in binding_keys
+        binding_keys = {b.key for b in MonitorApp.BINDINGS}
+        assert {"ctrl+q", "1", "2", "3", "4", "ctrl+r"} <= binding_keys
 
     def test_css_path_exists(self) -> None:
         """Test that CSS path is defined."""
-        app = MonitorApp()
-        assert app.CSS_PATH is not None
-        assert app.CSS_PATH.name == "styles.css"
+        assert MonitorApp.CSS_PATH is not None
+        assert MonitorApp.CSS_PATH.name == "styles.css"
 
-    @pytest.mark.asyncio
-    async def test_app_creates_client(self) -> None:
+    def test_app_creates_client(self) -> None:
         """Test that app creates a MonitorClient."""
         app = MonitorApp()
         assert app._client is not None
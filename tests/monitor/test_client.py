@@ -6,12 +6,70 @@ Purpose: Tests for MonitorClient
 # ruff: noqa: SIM105 - contextlib.suppress doesn't work with await in test cleanup
 
 import asyncio
-from unittest.mock import AsyncMock, MagicMock, patch
+import json
+from typing import Any
 
 import pytest
 
+from safeshell.monitor import client as monitor_client
 from safeshell.monitor.client import MonitorClient
 
+# Canned frames from the daemon
+_PING_OK = b'{"success": true}\n'
+_EVENT_MSG = b'{"type": "event", "data": {"test": "value"}}\n'
+_EVENT_NO_DATA = b'{"type": "event"}\n'
+_INVALID_JSON = b"not valid json\n"
+_CLOSED = b""
+
+
+def _ignore_event(_event: dict[str, Any]) -> None:
+    """Event callback that does nothing; tests only check its registration."""
+
+
+class FakeReader:
+    """Minimal stand-in for asyncio.StreamReader serving canned lines, then EOF."""
+
+    def __init__(self, lines: list[bytes]) -> None:
+        self._lines = iter(lines)
+
+    async def readline(self) -> bytes:
+        return next(self._lines, _CLOSED)
+
+
+class FakeWriter:
+    """Minimal stand-in for asyncio.StreamWriter that records writes."""
+
+    def __init__(self) -> None:
+        self.buf: list[bytes] = []
+        self.closed = False
+
+    def write(self, data: bytes) -> None:
+        self.buf.append(data)
+
+    async def drain(self) -> None:
+        pass
+
+    def close(self) -> None:
+        self.closed = True
+
+    async def wait_closed(self) -> None:
+        pass
+
+
+@pytest.fixture
+def fake_writer() -> FakeWriter:
+    """Create a FakeWriter to capture what a client sends."""
+    return FakeWriter()
+
+
+@pytest.fixture
+def connected_client(fake_writer: FakeWriter) -> MonitorClient:
+    """Create a client marked connected, writing to fake_writer."""
+    client = MonitorClient()
+    client._connected = True
+    client._writer = fake_writer
+    return client
+
 
 class TestMonitorClient:
     """Tests for MonitorClient."""
@@ -26,41 +84,36 @@ class TestMonitorClient:
     def test_add_event_callback(self) -> None:
         """Test adding event callbacks."""
         client = MonitorClient()
-        callback = MagicMock()
 
-        client.add_event_callback(callback)
-        assert callback in client._event_callbacks
+        client.add_event_callback(_ignore_event)
+        assert _ignore_event in client._event_callbacks
 
     def test_remove_event_callback(self) -> None:
         """Test removing event callbacks."""
         client = MonitorClient()
-        callback = MagicMock()
 
-        client.add_event_callback(callback)
-        client.remove_event_callback(callback)
-        assert callback not in client._event_callbacks
+        client.add_event_callback(_ignore_event)
+        client.remove_event_callback(_ignore_event)
+        assert _ignore_event not in client._event_callbacks
 
     def test_remove_nonexistent_callback(self) -> None:
         """Test removing a callback that wasn't added."""
         client = MonitorClient()
-        callback = MagicMock()
 
         # Should not raise
-        client.remove_event_callback(callback)
+        client.remove_event_callback(_ignore_event)
 
-    @pytest.mark.asyncio
-    async def test_connect_failure(self) -> None:
+    @pytest.mark.asyncio(loop_scope="module")
+    async def test_connect_failure(self, monkeypatch: pytest.MonkeyPatch) -> None:
         """Test connection failure when daemon not running."""
         client = MonitorClient()
+        monkeypatch.setattr(monitor_client, "MONITOR_SOCKET_PATH", "/nonexistent/socket")
 
-        with patch("safeshell.monitor.client.MONITOR_SOCKET_PATH") as mock_path:
-            mock_path.__str__ = MagicMock(return_value="/nonexistent/socket")
-
-            connected = await client.connect()
-            assert not connected
-            assert not client.connected
+        connected = await client.connect()
+        assert not connected
+        assert not client.connected
 
-    @pytest.mark.asyncio
+    @pytest.mark.asyncio(loop_scope="module")
     async def test_disconnect_when_not_connected(self) -> None:
         """Test disconnect when not connected does nothing."""
         client = MonitorClient()
@@ -69,105 +122,147 @@ class TestMonitorClient:
         await client.disconnect()
         assert not client.connected
 
-    @pytest.mark.asyncio
-    async def test_ping_when_not_connected(self) -> None:
-        """Test ping returns False when not connected."""
-        client = MonitorClient()
-
-        result = await client.ping()
-        assert not result
-
-    @pytest.mark.asyncio
-    async def test_approve_when_not_connected(self) -> None:
-        """Test approve returns False when not connected."""
-        client = MonitorClient()
-
-        result = await client.approve("test-approval-id")
-        assert not result
-
-    @pytest.mark.asyncio
-    async def test_deny_when_not_connected(self) -> None:
-        """Test deny returns False when not connected."""
+    @pytest.mark.asyncio(loop_scope="module")
+    @pytest.mark.parametrize(
+        ("method", "args", "kwargs"),
+        [
+            ("ping", (), {}),
+            ("approve", ("test-approval-id",), {}),
+            ("deny", ("test-approval-id", "test reason"), {}),
+            ("deny", ("test-approval-id", "test reason"), {"remember": True}),
+        ],
+    )
+    async def test_when_not_connected(
+        self, method: str, args: tuple[Any, ...], kwargs: dict[str, Any]
+    ) -> None:
+        """Test commands return False when not connected."""
         client = MonitorClient()
 
-        result = await client.deny("test-approval-id", "test reason")
+        result = await getattr(client, method)(*args, **kwargs)
         assert not result
 
-    @pytest.mark.asyncio
-    async def test_deny_with_remember_when_not_connected(self) -> None:
-        """Test deny with remember flag returns False when not connected."""
-        client = MonitorClient()
-
-        result = await client.deny("test-approval-id", "test reason", remember=True)
-        assert not result
-
-    @pytest.mark.asyncio
-    async def test_start_receiving_without_task(self) -> None:
+    @pytest.mark.asyncio(loop_scope="module")
+    async def test_start_receiving_without_task(self, connected_client: MonitorClient) -> None:
         """Test that start_receiving creates a task."""
-        client = MonitorClient()
-        client._connected = True
-        client._reader = AsyncMock()
-        client._reader.readline = AsyncMock(side_effect=asyncio.CancelledError)
+        connected_client._reader = FakeReader([])
 
-        await client.start_receiving()
-        assert client._receive_task is not None
+        await connected_client.start_receiving()
+        assert connected_client._receive_task is not None
 
         # Clean up
-        client._receive_task.cancel()
+        connected_client._receive_task.cancel()
         try:
-            await client._receive_task
+            await connected_client._receive_task
         except asyncio.CancelledError:
             pass
 
-    @pytest.mark.asyncio
-    async def test_event_callback_dispatch(self) -> None:
+    @pytest.mark.asyncio(loop_scope="module")
+    async def test_event_callback_dispatch(self, connected_client: MonitorClient) -> None:
         """Test that events are dispatched to callbacks."""
-        client = MonitorClient()
-        client._connected = True
-
-        callback = MagicMock()
-        client.add_event_callback(callback)
+        received: list[dict[str, Any]] = []
+        connected_client.add_event_callback(received.append)
 
-        # Create mock reader that returns one message then closes
-        mock_reader = AsyncMock()
-        mock_reader.readline = AsyncMock(
-            side_effect=[
-                b'{"type": "event", "data": {"test": "value"}}\n',
-                b"",  # Connection closed
-            ]
-        )
-        client._reader = mock_reader
+        # Reader returns one message then closes
+        connected_client._reader = FakeReader([_EVENT_MSG])
 
         # Run receive loop until it exits
-        await client._receive_loop()
+        await connected_client._receive_loop()
 
         # Callback should have been called
-        callback.assert_called_once()
-        call_args = callback.call_args[0][0]
-        assert call_args["type"] == "event"
+        assert len(received) == 1
+        assert received[0]["type"] == "event"
 
-    @pytest.mark.asyncio
-    async def test_callback_error_handling(self) -> None:
+    @pytest.mark.asyncio(loop_scope="module")
+    async def test_callback_error_handling(self, connected_client: MonitorClient) -> None:
         """Test that callback errors don't stop the receive loop."""
-        client = MonitorClient()
-        client._connected = True
+        calls: list[str] = []
+
+        def failing(_event: dict[str, Any]) -> None:
+            calls.append("failing")
+            raise Exception("test error")
 
         # First callback raises, second should still be called
-        callback1 = MagicMock(side_effect=Exception("test error"))
-        callback2 = MagicMock()
-        client.add_event_callback(callback1)
-        client.add_event_callback(callback2)
-
-        mock_reader = AsyncMock()
-        mock_reader.readline = AsyncMock(
-            side_effect=[
-                b'{"type": "event"}\n',
-                b"",  # Connection closed
-            ]
-        )
-        client._reader = mock_reader
-
-        await client._receive_loop()
-
-        callback1.assert_called_once()
-        callback2.assert_called_once()
+        connected_client.add_event_callback(failing)
+        connected_client.add_event_callback(lambda _event: calls.append("second"))
+
+        connected_client._reader = FakeReader([_EVENT_NO_DATA])
+
+        await connected_client._receive_loop()
+
+        assert calls == ["failing", "second"]
+
+    @pytest.mark.asyncio(loop_scope="module")
+    async def test_receive_loop_handles_json_error(self, connected_client: MonitorClient) -> None:
+        """Test that an undecodable message ends the receive loop cleanly."""
+        received: list[dict[str, Any]] = []
+        connected_client.add_event_callback(received.append)
+        connected_client._reader = FakeReader([_INVALID_JSON])
+
+        await connected_client._receive_loop()
+
+        assert received == []
+        assert not connected_client.connected
+
+    @pytest.mark.asyncio(loop_scope="module")
+    async def test_approve_writes_to_socket(
+        self, connected_client: MonitorClient, fake_writer: FakeWriter
+    ) -> None:
+        """Test approve sends an approve command."""
+        result = await connected_client.approve("test-approval-id")
+
+        assert result is True
+        assert len(fake_writer.buf) == 1
+        sent = json.loads(fake_writer.buf[0].decode())
+        assert sent["type"] == "approve"
+        assert sent["approval_id"] == "test-approval-id"
+        assert sent["remember"] is False
+
+    @pytest.mark.asyncio(loop_scope="module")
+    async def test_approve_sends_command_with_remember(
+        self, connected_client: MonitorClient, fake_writer: FakeWriter
+    ) -> None:
+        """Test approve forwards the remember flag."""
+        assert await connected_client.approve("test-approval-id", remember=True) is True
+        assert json.loads(fake_writer.buf[0].decode())["remember"] is True
+
+    @pytest.mark.asyncio(loop_scope="module")
+    async def test_deny_writes_to_socket(
+        self, connected_client: MonitorClient, fake_writer: FakeWriter
+    ) -> None:
+        """Test deny sends a deny command."""
+        result = await connected_client.deny("test-approval-id")
+
+        assert result is True
+        assert len(fake_writer.buf) == 1
+        sent = json.loads(fake_writer.buf[0].decode())
+        assert sent["type"] == "deny"
+        assert sent["approval_id"] == "test-approval-id"
+
+    @pytest.mark.asyncio(loop_scope="module")
+    async def test_deny_sends_command_with_reason(
+        self, connected_client: MonitorClient, fake_writer: FakeWriter
+    ) -> None:
+        """Test deny forwards the reason."""
+        assert await connected_client.deny("test-approval-id", "not today") is True
+        assert json.loads(fake_writer.buf[0].decode())["reason"] == "not today"
+
+    @pytest.mark.asyncio(loop_scope="module")
+    async def test_ping_sends_command(
+        self, connected_client: MonitorClient, fake_writer: FakeWriter
+    ) -> None:
+        """Test ping writes a ping command and reads the reply."""
+        connected_client._reader = FakeReader([_PING_OK])
+
+        assert await connected_client.ping() is True
+        assert json.loads(fake_writer.buf[0].decode())["type"] == "ping"
+
+    @pytest.mark.asyncio(loop_scope="module")
+    async def test_disconnect_closes_writer(
+        self, connected_client: MonitorClient, fake_writer: FakeWriter
+    ) -> None:
+        """Test disconnect closes the writer and resets state."""
+        await connected_client.disconnect()
+
+        assert fake_writer.closed
+        assert connected_client._writer is None
+        assert not connected_client.connected
@@ -5,8 +5,14 @@ Purpose: Tests for monitor TUI widgets
 
 from datetime import datetime
 
+import pytest
+from textual.widget import Widget
+
 from safeshell.monitor.widgets import ApprovalPane, CommandHistoryItem, DebugPane, HistoryPane
 
+# Tests only compare timestamps for equality, so a fixed value suffices
+_FIXED_TS = datetime(2024, 1, 1, 12, 0, 0)
+
 
 class TestCommandHistoryItem:
     """Tests for CommandHistoryItem model."""
@@ -15,7 +21,7 @@ class TestCommandHistoryItem:
         """Test creating a basic history item."""
         item = CommandHistoryItem(
             command="git commit -m test",
-            timestamp=datetime.now(),
+            timestamp=_FIXED_TS,
         )
         assert item.command == "git commit -m test"
         assert item.status == "pending"
@@ -25,7 +31,7 @@ class TestCommandHistoryItem:
 
     def test_create_with_all_fields(self) -> None:
         """Test creating item with all fields."""
-        now = datetime.now()
+        now = _FIXED_TS
         item = CommandHistoryItem(
             command="git push --force",
             timestamp=now,
@@ -42,32 +48,19 @@ class TestCommandHistoryItem:
         assert item.approval_id == "test-id-123"
 
 
-class TestDebugPane:
-    """Tests for DebugPane widget."""
-
-    def test_default_css_exists(self) -> None:
-        """Test that DEFAULT_CSS is defined."""
-        assert DebugPane.DEFAULT_CSS is not None
-        assert "DebugPane" in DebugPane.DEFAULT_CSS
+class TestDefaultCss:
+    """Tests for widget DEFAULT_CSS definitions."""
 
-
-class TestHistoryPane:
-    """Tests for HistoryPane widget."""
-
-    def test_default_css_exists(self) -> None:
-        """Test that DEFAULT_CSS is defined."""
-        assert HistoryPane.DEFAULT_CSS is not None
-        assert "HistoryPane" in HistoryPane.DEFAULT_CSS
+    @pytest.mark.parametrize("widget", [DebugPane, HistoryPane, ApprovalPane])
+    def test_default_css_exists(self, widget: type[Widget]) -> None:
+        """Test that DEFAULT_CSS is defined and styles the widget."""
+        assert widget.DEFAULT_CSS is not None
+        assert widget.__name__ in widget.DEFAULT_CSS
 
 
 class TestApprovalPane:
     """Tests for ApprovalPane widget."""
 
-    def test_default_css_exists(self) -> None:
-        """Test that DEFAULT_CSS is defined."""
-        assert ApprovalPane.DEFAULT_CSS is not None
-        assert "ApprovalPane" in ApprovalPane.DEFAULT_CSS
-
     def test_approval_action_message(self) -> None:
         """Test ApprovalAction message creation."""
         action = ApprovalPane.ApprovalAction(
@@ -1,15 +1,17 @@
 """Tests for safeshell.rules.cache module."""
 
-import tempfile
-import time
+import os
 from pathlib import Path
-from unittest.mock import patch
 
 import pytest
 
 from safeshell.rules.cache import CachedRuleSet, RuleCache
 from safeshell.rules.schema import Rule, RuleAction
 
+# Names RuleCache resolves from its own module namespace
+_LOAD_RULE_FILE = "safeshell.rules.cache._load_rule_file"
+_GLOBAL_RULES_PATH = "safeshell.rules.cache.GLOBAL_RULES_PATH"
+
 
 @pytest.fixture
 def sample_rules() -> list[Rule]:
@@ -30,6 +32,21 @@ def sample_rules() -> list[Rule]:
     ]
 
 
+@pytest.fixture
+def rules_env(
+    sample_rules: list[Rule], tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> tuple[Path, Path]:
+    """Serve sample_rules from a global rules file inside tmp_path.
+
+    Returns the working directory and the rules file path.
+    """
+    rules_path = tmp_path / "rules.yaml"
+    rules_path.write_text("rules: []")
+    monkeypatch.setattr(_LOAD_RULE_FILE, lambda _path: (sample_rules, []))
+    monkeypatch.setattr(_GLOBAL_RULES_PATH, rules_path)
+    return tmp_path, rules_path
+
+
 class TestCachedRuleSet:
     """Tests for CachedRuleSet dataclass."""
 
@@ -62,182 +79,156 @@ class TestRuleCache:
         assert cache.stats["misses"] == 0
         assert cache.stats["cached_entries"] == 0
 
-    def test_cache_miss_on_first_request(self, sample_rules: list[Rule]) -> None:
+    def test_cache_miss_on_first_request(
+        self, sample_rules: list[Rule], tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
         """Test first request is a cache miss."""
         cache = RuleCache()
+        monkeypatch.setattr(_LOAD_RULE_FILE, lambda _path: (sample_rules, []))
+        monkeypatch.setattr(_GLOBAL_RULES_PATH, tmp_path / "nonexistent.yaml")
 
-        with (
-            tempfile.TemporaryDirectory() as tmpdir,
-            patch("safeshell.rules.cache._load_rule_file", return_value=(sample_rules, [])),
-            patch(
-                "safeshell.rules.cache.GLOBAL_RULES_PATH",
-                Path(tmpdir) / "nonexistent.yaml",
-            ),
-        ):
-            rules, cache_hit = cache.get_rules(tmpdir)
+        rules, cache_hit = cache.get_rules(str(tmp_path))
 
         assert cache_hit is False
         assert cache.stats["misses"] == 1
         assert cache.stats["hits"] == 0
 
-    def test_cache_hit_on_second_request(self, sample_rules: list[Rule]) -> None:
+    def test_cache_hit_on_second_request(self, rules_env: tuple[Path, Path]) -> None:
         """Test second request to same directory is a cache hit."""
         cache = RuleCache()
+        working_dir, _ = rules_env
 
-        with tempfile.TemporaryDirectory() as tmpdir:
-            # Create a rules file
-            rules_path = Path(tmpdir) / "rules.yaml"
-            rules_path.write_text("rules: []")
-
-            with (
-                patch(
-                    "safeshell.rules.cache._load_rule_file",
-                    return_value=(sample_rules, []),
-                ),
-                patch("safeshell.rules.cache.GLOBAL_RULES_PATH", rules_path),
-            ):
-                # First request - cache miss
-                rules1, hit1 = cache.get_rules(tmpdir)
-                assert hit1 is False
-
-                # Second request - cache hit
-                rules2, hit2 = cache.get_rules(tmpdir)
-                assert hit2 is True
+        # First request - cache miss
+        rules1, hit1 = cache.get_rules(str(working_dir))
+        assert hit1 is False
+
+        # Second request - cache hit
+        rules2, hit2 = cache.get_rules(str(working_dir))
+        assert hit2 is True
 
         assert cache.stats["misses"] == 1
         assert cache.stats["hits"] == 1
         assert rules1 == rules2
 
-    def test_cache_invalidation_on_file_change(self, sample_rules: list[Rule]) -> None:
+    def test_cache_invalidation_on_file_change(self, rules_env: tuple[Path, Path]) -> None:
         """Test cache is invalidated when rule file is modified."""
         cache = RuleCache()
+        working_dir, rules_path = rules_env
+
+        # First request - cache miss
+        _, hit1 = cache.get_rules(str(working_dir))
+        assert hit1 is False
+
+        # Modify the file, then push its mtime forward so the change is seen
+        # even on filesystems with coarse timestamps
+        rules_path.write_text("rules: []\n# modified")
+        st = rules_path.stat()
+        os.utime(rules_path, (st.st_atime, st.st_mtime + 1.0))
 
-        with tempfile.TemporaryDirectory() as tmpdir:
-            # Create a rules file
-            rules_path = Path(tmpdir) / "rules.yaml"
-            rules_path.write_text("rules: []")
-
-            with (
-                patch(
-                    "safeshell.rules.cache._load_rule_file",
-                    return_value=(sample_rules, []),
-                ),
-                patch("safeshell.rules.cache.GLOBAL_RULES_PATH", rules_path),
-            ):
-                # First request - cache miss
-                _, hit1 = cache.get_rules(tmpdir)
-                assert hit1 is False
-
-                # Modify the file (need to ensure different mtime)
-                time.sleep(0.01)  # Ensure mtime changes
-                rules_path.write_text("rules: []\n# modified")
-
-                # Third request - should be cache miss due to mtime change
-                _, hit3 = cache.get_rules(tmpdir)
-                assert hit3 is False
+        # Second request - should be cache miss due to mtime change
+        _, hit2 = cache.get_rules(str(working_dir))
+        assert hit2 is False
 
         assert cache.stats["misses"] == 2
 
-    def test_cache_invalidation_on_file_deletion(self, sample_rules: list[Rule]) -> None:
+    def test_cache_invalidation_on_file_deletion(self, rules_env: tuple[Path, Path]) -> None:
         """Test cache is invalidated when rule file is deleted."""
         cache = RuleCache()
+        working_dir, rules_path = rules_env
+
+        # First request - cache miss
+        _, hit1 = cache.get_rules(str(working_dir))
+        assert hit1 is False
+
+        # Delete the file
+        rules_path.unlink()
 
-        with tempfile.TemporaryDirectory() as tmpdir:
-            # Create a rules file
-            rules_path = Path(tmpdir) / "rules.yaml"
-            rules_path.write_text("rules: []")
-
-            with (
-                patch(
-                    "safeshell.rules.cache._load_rule_file",
-                    return_value=(sample_rules, []),
-                ),
-                patch("safeshell.rules.cache.GLOBAL_RULES_PATH", rules_path),
-            ):
-                # First request - cache miss
-                _, hit1 = cache.get_rules(tmpdir)
-                assert hit1 is False
-
-                # Delete the file
-                rules_path.unlink()
-
-                # Second request - should be cache miss due to file deletion
-                _, hit2 = cache.get_rules(tmpdir)
-                assert hit2 is False
+        # Second request - should be cache miss due to file deletion
+        _, hit2 = cache.get_rules(str(working_dir))
+        assert hit2 is False
 
         assert cache.stats["misses"] == 2
 
-    def test_manual_invalidation_all(self, sample_rules: list[Rule]) -> None:
+    def test_manual_invalidation_all(
+        self,
+        sample_rules: list[Rule],
+        tmp_path_factory: pytest.TempPathFactory,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
         """Test manual invalidation of entire cache."""
         cache = RuleCache()
+        tmpdir1 = tmp_path_factory.mktemp("a")
+        tmpdir2 = tmp_path_factory.mktemp("b")
 
-        with (
-            tempfile.TemporaryDirectory() as tmpdir1,
-            tempfile.TemporaryDirectory() as tmpdir2,
-        ):
-            # Create rules files
-            rules1 = Path(tmpdir1) / "rules.yaml"
-            rules1.write_text("rules: []")
-            rules2 = Path(tmpdir2) / "rules.yaml"
-            rules2.write_text("rules: []")
-
-            with patch("safeshell.rules.cache._load_rule_file", return_value=(sample_rules, [])):
-                # Populate cache for both directories
-                with patch("safeshell.rules.cache.GLOBAL_RULES_PATH", rules1):
-                    cache.get_rules(tmpdir1)
-                with patch("safeshell.rules.cache.GLOBAL_RULES_PATH", rules2):
-                    cache.get_rules(tmpdir2)
-
-                assert cache.stats["cached_entries"] == 2
-
-                # Invalidate all
-                cache.invalidate()
-                assert cache.stats["cached_entries"] == 0
-
-    def test_manual_invalidation_specific_dir(self, sample_rules: list[Rule]) -> None:
+        # Create rules files
+        rules1 = tmpdir1 / "rules.yaml"
+        rules1.write_text("rules: []")
+        rules2 = tmpdir2 / "rules.yaml"
+        rules2.write_text("rules: []")
+
+        monkeypatch.setattr(_LOAD_RULE_FILE, lambda _path: (sample_rules, []))
+
+        # Populate cache for both directories
+        monkeypatch.setattr(_GLOBAL_RULES_PATH, rules1)
+        cache.get_rules(str(tmpdir1))
+        monkeypatch.setattr(_GLOBAL_RULES_PATH, rules2)
+        cache.get_rules(str(tmpdir2))
+
+        assert cache.stats["cached_entries"] == 2
+
+        # Invalidate all
+        cache.invalidate()
+        assert cache.stats["cached_entries"] == 0
+
+    def test_manual_invalidation_specific_dir(
+        self,
+        sample_rules: list[Rule],
+        tmp_path_factory: pytest.TempPathFactory,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
         """Test manual invalidation of specific directory."""
         cache = RuleCache()
-
-        with (
-            tempfile.TemporaryDirectory() as tmpdir1,
-            tempfile.TemporaryDirectory() as tmpdir2,
-        ):
-            # Create rules files
-            rules1 = Path(tmpdir1) / "rules.yaml"
-            rules1.write_text("rules: []")
-            rules2 = Path(tmpdir2) / "rules.yaml"
-            rules2.write_text("rules: []")
-
-            with patch("safeshell.rules.cache._load_rule_file", return_value=(sample_rules, [])):
-                # Populate cache for both directories
-                with patch("safeshell.rules.cache.GLOBAL_RULES_PATH", rules1):
-                    cache.get_rules(tmpdir1)
-                with patch("safeshell.rules.cache.GLOBAL_RULES_PATH", rules2):
-                    cache.get_rules(tmpdir2)
-
-                assert cache.stats["cached_entries"] == 2
-
-                # Invalidate only tmpdir1
-                cache.invalidate(tmpdir1)
-                assert cache.stats["cached_entries"] == 1
-
-    def test_different_working_dirs_cached_separately(self, sample_rules: list[Rule]) -> None:
+        tmpdir1 = tmp_path_factory.mktemp("a")
+        tmpdir2 = tmp_path_factory.mktemp("b")
+
+        # Create rules files
+        rules1 = tmpdir1 / "rules.yaml"
+        rules1.write_text("rules: []")
+        rules2 = tmpdir2 / "rules.yaml"
+        rules2.write_text("rules: []")
+
+        monkeypatch.setattr(_LOAD_RULE_FILE, lambda _path: (sample_rules, []))
+
+        # Populate cache for both directories
+        monkeypatch.setattr(_GLOBAL_RULES_PATH, rules1)
+        cache.get_rules(str(tmpdir1))
+        monkeypatch.setattr(_GLOBAL_RULES_PATH, rules2)
+        cache.get_rules(str(tmpdir2))
+
+        assert cache.stats["cached_entries"] == 2
+
+        # Invalidate only tmpdir1
+        cache.invalidate(str(tmpdir1))
+        assert cache.stats["cached_entries"] == 1
+
+    def test_different_working_dirs_cached_separately(
+        self,
+        sample_rules: list[Rule],
+        tmp_path_factory: pytest.TempPathFactory,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
         """Test different working directories have separate cache entries."""
         cache = RuleCache()
+        tmpdir1 = tmp_path_factory.mktemp("a")
+        tmpdir2 = tmp_path_factory.mktemp("b")
+
+        monkeypatch.setattr(_LOAD_RULE_FILE, lambda _path: (sample_rules, []))
+        monkeypatch.setattr(_GLOBAL_RULES_PATH, Path("/nonexistent/rules.yaml"))
 
-        with (
-            tempfile.TemporaryDirectory() as tmpdir1,
-            tempfile.TemporaryDirectory() as tmpdir2,
-            patch("safeshell.rules.cache._load_rule_file", return_value=(sample_rules, [])),
-            patch(
-                "safeshell.rules.cache.GLOBAL_RULES_PATH",
-                Path("/nonexistent/rules.yaml"),
-            ),
-        ):
-            # Request rules for both directories
-            cache.get_rules(tmpdir1)
-            cache.get_rules(tmpdir2)
-
-            # Both should be cached separately
-            assert cache.stats["cached_entries"] == 2
-            assert cache.stats["misses"] == 2
+        # Request rules for both directories
+        cache.get_rules(str(tmpdir1))
+        cache.get_rules(str(tmpdir2))
+
+        # Both should be cached separately
+        assert cache.stats["cached_entries"] == 2
+        assert cache.stats["misses"] == 2
@@ -6,6 +6,7 @@ import tempfile
 from pathlib import Path
 
 import pytest
+from pydantic import ValidationError
 
 from safeshell.models import CommandContext, ExecutionContext
 from safeshell.rules.condition_types import (
@@ -82,6 +83,11 @@ class TestCommandMatches:
         condition = CommandMatches(command_matches=r"^git\s+push.*(--force|-f)")
         assert condition.evaluate(context) is True
 
+    def test_invalid_pattern_rejected_at_construction(self) -> None:
+        """Test a malformed regex fails validation instead of at evaluation."""
+        with pytest.raises(ValidationError, match="Invalid regex"):
+            CommandMatches(command_matches="(unclosed")
+
 
 class TestCommandContains:
     """Tests for CommandContains condition."""
@@ -72,6 +72,25 @@ rules:
             _load_rule_file(rules_file)
         assert "Invalid rule schema" in str(exc_info.value)
 
+    def test_load_invalid_regex_names_rule_and_pattern(self, tmp_path: Path) -> None:
+        """Test a malformed condition regex fails the file load, naming rule and pattern."""
+        rules_file = tmp_path / "rules.yaml"
+        rules_file.write_text("""
+rules:
+  - name: bad-pattern
+    commands: ["git"]
+    conditions:
+      - command_matches: "(unclosed"
+    action: deny
+    message: "Blocked"
+""")
+        with pytest.raises(RuleLoadError) as exc_info:
+            _load_rule_file(rules_file)
+        message = str(exc_info.value)
+        assert "Invalid rule schema" in message
+        assert "'bad-pattern'" in message
+        assert "Invalid regex '(unclosed'" in message
+
     def test_load_multiple_rules(self, tmp_path: Path) -> None:
         """Test loading multiple rules from one file."""
         rules_file = tmp_path / "rules.yaml"
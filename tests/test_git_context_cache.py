@@ -95,6 +95,22 @@ class TestGitContextCache:
         assert "/path/to/dir0" not in _git_context_cache
         assert "/path/to/dir1" not in _git_context_cache
 
+    def test_prune_spares_recently_used_entries(self) -> None:
+        """Test that a cache hit protects an entry from the next prune."""
+        with (
+            tempfile.TemporaryDirectory() as tmpdir1,
+            tempfile.TemporaryDirectory() as tmpdir2,
+        ):
+            CommandContext._detect_git_context(tmpdir1)
+            CommandContext._detect_git_context(tmpdir2)
+
+            # Hit the older entry so tmpdir2 becomes least recently used
+            CommandContext._detect_git_context(tmpdir1)
+            CommandContext._prune_git_context_cache()
+
+            assert tmpdir1 in _git_context_cache
+            assert tmpdir2 not in _git_context_cache
+
     def test_cache_different_directories(self) -> None:
         """Test that different directories are cached independently."""
         with (